@@ -0,0 +1,40 @@
+"""Add order status indexes
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-01-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY avoids locking orders against writes; it cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_orders_user_status_created', 'orders',
+            ['user_id', 'status', 'created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_orders_user_open', 'orders',
+            ['user_id', 'created_at'],
+            unique=False,
+            postgresql_where=sa.text("status IN ('PENDING', 'SUBMITTED')"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_orders_user_open', table_name='orders', postgresql_concurrently=True)
+        op.drop_index('ix_orders_user_status_created', table_name='orders', postgresql_concurrently=True)
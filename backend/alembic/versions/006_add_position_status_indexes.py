@@ -0,0 +1,39 @@
+"""Add position status indexes
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-01-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY avoids locking positions against writes; it cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_positions_user_status_created', 'positions',
+            ['user_id', 'status', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_positions_user_status_exit', 'positions',
+            ['user_id', 'status', 'exit_time'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_positions_user_status_exit', table_name='positions', postgresql_concurrently=True)
+        op.drop_index('ix_positions_user_status_created', table_name='positions', postgresql_concurrently=True)
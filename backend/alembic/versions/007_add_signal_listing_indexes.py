@@ -0,0 +1,39 @@
+"""Add signal listing indexes
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-01-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY avoids locking signals against writes; it cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_signals_user_created', 'signals',
+            ['user_id', 'created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_signals_user_status_created', 'signals',
+            ['user_id', 'status', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_signals_user_status_created', table_name='signals', postgresql_concurrently=True)
+        op.drop_index('ix_signals_user_created', table_name='signals', postgresql_concurrently=True)
@@ -0,0 +1,32 @@
+"""Add order time index
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-01-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY avoids locking orders against writes; it cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_orders_user_order_time', 'orders',
+            ['user_id', 'order_time'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_orders_user_order_time', table_name='orders', postgresql_concurrently=True)
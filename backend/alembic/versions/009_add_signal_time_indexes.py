@@ -0,0 +1,39 @@
+"""Add signal time indexes
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-01-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY avoids locking signals against writes; it cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_signals_user_time', 'signals',
+            ['user_id', 'signal_time'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_signals_symbol_time', 'signals',
+            ['symbol', 'signal_time'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_signals_symbol_time', table_name='signals', postgresql_concurrently=True)
+        op.drop_index('ix_signals_user_time', table_name='signals', postgresql_concurrently=True)
@@ -1,7 +1,17 @@
 """
 API v1 Endpoints
+Endpoint modules are imported lazily on first attribute access (PEP 562)
 """
 
-from app.api.v1.endpoints import auth, signals, signals_smc, orders, portfolio, market
+from importlib import import_module
 
-__all__ = ["auth", "signals", "signals_smc", "orders", "portfolio", "market"]
+__all__ = ["auth", "signals", "signals_smc", "orders", "portfolio", "market", "health"]
+
+
+def __getattr__(name: str):
+    """Import an endpoint module the first time it is requested"""
+    if name in __all__:
+        module = import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
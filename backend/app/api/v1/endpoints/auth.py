@@ -3,12 +3,18 @@ Authentication Endpoints
 User registration, login, token management
 """
 
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Annotated
+from typing import Annotated, Optional
 
+import pyotp
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy import select
+from sqlalchemy import case, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core import (
@@ -19,6 +25,7 @@ from app.core import (
     get_password_hash,
     verify_password,
     verify_token,
+    verify_token_claims,
 )
 from app.models import User, UserRole, Plan
 from app.schemas import (
@@ -32,16 +39,76 @@ from app.schemas import (
 router = APIRouter()
 security = HTTPBearer()
 
+_ACCESS_EXPIRES_IN = settings.access_token_expire_minutes * 60
+
+MAX_FAILED_LOGIN_ATTEMPTS = 5
+LOCKOUT_MINUTES = 30
+
+# Recently verified access tokens: sha256(token) -> (user_id, exp).
+# Keyed by hash so raw tokens are never held in memory; the short TTL bounds
+# how long a token is trusted without re-checking its signature.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# Verified against when the login email is unknown, so both paths cost one
+# bcrypt check and response timing does not reveal which accounts exist.
+_DUMMY_HASH = get_password_hash("unused-dummy-password")
+
+# Unique indexes on users -> registration error when a signup violates them
+_DUPLICATE_USER_DETAILS = {
+    "ix_users_email": "Email already registered",
+    "ix_users_mobile": "Mobile number already registered",
+}
+
+# SQLite reports the violated columns rather than the index name
+_SQLITE_UNIQUE_COLUMNS = {
+    "users.email": "ix_users_email",
+    "users.mobile": "ix_users_mobile",
+}
+
 
 # ==================== DEPENDENCIES ====================
 
+def _violated_constraint(error: IntegrityError) -> Optional[str]:
+    """Name of the unique index an IntegrityError reports, if it names one"""
+    # asyncpg: the driver exception carries the constraint name
+    constraint = getattr(error.orig.__cause__, "constraint_name", None)
+    if constraint is not None:
+        return constraint
+
+    # SQLite: "UNIQUE constraint failed: users.email"
+    prefix, _, columns = str(error.orig).partition(": ")
+    if prefix == "UNIQUE constraint failed":
+        return _SQLITE_UNIQUE_COLUMNS.get(columns)
+    return None
+
+
+def _verify_access_token(token: str) -> Optional[str]:
+    """Verify an access token, reusing a recent verification of the same token"""
+    key = hashlib.sha256(token.encode()).digest()
+
+    cached = _token_cache.get(key)
+    if cached is not None:
+        user_id, exp = cached
+        if exp is None or exp > time.time():
+            return user_id
+        _token_cache.pop(key, None)
+
+    claims = verify_token_claims(token)
+    if claims is None:
+        return None
+
+    user_id = claims["sub"]
+    _token_cache[key] = (user_id, claims.get("exp"))
+    return user_id
+
+
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> User:
     """Get current authenticated user"""
     token = credentials.credentials
-    user_id = verify_token(token)
+    user_id = _verify_access_token(token)
     
     if not user_id:
         raise HTTPException(
@@ -49,8 +116,7 @@ async def get_current_user(
             detail="Invalid or expired token",
         )
     
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, int(user_id))
     
     if not user:
         raise HTTPException(
@@ -75,17 +141,20 @@ async def register(
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     """Register a new user"""
-    # Check if email exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    if result.scalar_one_or_none():
+    # Check if email or mobile exists (single roundtrip) before paying for
+    # the bcrypt hash
+    result = await db.execute(
+        select(User.email, User.mobile).where(
+            (User.email == user_data.email) | (User.mobile == user_data.mobile)
+        )
+    )
+    existing = result.all()
+    if any(row.email == user_data.email for row in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
-    
-    # Check if mobile exists
-    result = await db.execute(select(User).where(User.mobile == user_data.mobile))
-    if result.scalar_one_or_none():
+    if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Mobile number already registered"
@@ -97,7 +166,7 @@ async def register(
         mobile=user_data.mobile,
         first_name=user_data.first_name,
         last_name=user_data.last_name,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await run_in_threadpool(get_password_hash, user_data.password),
         role=UserRole.TRADER,
         plan=Plan.FREE,
         is_active=True,
@@ -105,8 +174,20 @@ async def register(
         onboarding_completed=False,
     )
     
+    # The ix_users_email / ix_users_mobile unique indexes catch a concurrent
+    # registration that slipped past the check above
     db.add(user)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        detail = _DUPLICATE_USER_DETAILS.get(_violated_constraint(e))
+        if detail is None:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
     await db.refresh(user)
     
     return user
@@ -118,11 +199,21 @@ async def login(
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     """Login and get access tokens"""
-    # Find user
-    result = await db.execute(select(User).where(User.email == credentials.email))
-    user = result.scalar_one_or_none()
+    # Find user (only the columns the login checks need)
+    result = await db.execute(
+        select(
+            User.id,
+            User.hashed_password,
+            User.is_active,
+            User.mfa_enabled,
+            User.mfa_secret,
+            User.locked_until,
+        ).where(User.email == credentials.email)
+    )
+    user = result.first()
 
     if not user:
+        await run_in_threadpool(verify_password, credentials.password, _DUMMY_HASH)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -136,21 +227,33 @@ async def login(
             detail=f"Account is locked due to too many failed attempts. Try again in {remaining_time} minutes."
         )
 
-    # Verify password
-    if not verify_password(credentials.password, user.hashed_password):
-        # Increment failed attempts
-        user.failed_login_attempts += 1
+    # Verify password (bcrypt is CPU-bound, keep it off the event loop)
+    if not await run_in_threadpool(verify_password, credentials.password, user.hashed_password):
+        # Increment failed attempts and lock after too many, atomically in one statement
+        attempts = User.failed_login_attempts + 1
+        result = await db.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(
+                failed_login_attempts=attempts,
+                locked_until=case(
+                    (attempts >= MAX_FAILED_LOGIN_ATTEMPTS,
+                     datetime.utcnow() + timedelta(minutes=LOCKOUT_MINUTES)),
+                    else_=User.locked_until,
+                ),
+            )
+            .returning(User.failed_login_attempts)
+            .execution_options(synchronize_session=False)
+        )
+        failed_attempts = result.scalar_one()
+        await db.commit()
 
-        # Lock account after 5 failed attempts
-        if user.failed_login_attempts >= 5:
-            user.locked_until = datetime.utcnow() + timedelta(minutes=30)  # Lock for 30 minutes
-            await db.commit()
+        if failed_attempts >= MAX_FAILED_LOGIN_ATTEMPTS:
             raise HTTPException(
                 status_code=status.HTTP_423_LOCKED,
-                detail="Account locked due to too many failed attempts. Try again in 30 minutes."
+                detail=f"Account locked due to too many failed attempts. Try again in {LOCKOUT_MINUTES} minutes."
             )
 
-        await db.commit()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -170,7 +273,6 @@ async def login(
                 detail="TOTP code required"
             )
         # Verify TOTP code
-        import pyotp
         totp = pyotp.TOTP(user.mfa_secret)
         if not totp.verify(credentials.totp_code):
             raise HTTPException(
@@ -179,9 +281,12 @@ async def login(
             )
 
     # Reset failed attempts on successful login
-    user.failed_login_attempts = 0
-    user.locked_until = None
-    user.last_login = datetime.utcnow()
+    await db.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(failed_login_attempts=0, locked_until=None, last_login=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
 
     # Create tokens
@@ -192,7 +297,7 @@ async def login(
         access_token=access_token,
         refresh_token=refresh_token,
         token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
+        expires_in=_ACCESS_EXPIRES_IN,
     )
 
 
@@ -211,8 +316,10 @@ async def refresh_token(
             detail="Invalid refresh token"
         )
     
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    result = await db.execute(
+        select(User.id, User.is_active).where(User.id == int(user_id))
+    )
+    user = result.first()
     
     if not user or not user.is_active:
         raise HTTPException(
@@ -228,7 +335,7 @@ async def refresh_token(
         access_token=access_token,
         refresh_token=refresh_token,
         token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
+        expires_in=_ACCESS_EXPIRES_IN,
     )
 
 
@@ -247,13 +354,17 @@ async def change_password(
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     """Change user password"""
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await run_in_threadpool(
+        verify_password, password_data.current_password, current_user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
     
-    current_user.hashed_password = get_password_hash(password_data.new_password)
+    current_user.hashed_password = await run_in_threadpool(
+        get_password_hash, password_data.new_password
+    )
     current_user.last_password_change = datetime.utcnow()
     
     await db.commit()
@@ -3,17 +3,54 @@ Health Check Endpoint
 Production-grade health monitoring
 """
 
-from fastapi import APIRouter, Depends
-from typing import Dict, Any
+from fastapi import APIRouter, Depends, Request
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
 import time
 import platform
 
+from redis.asyncio import Redis
+
 from app.core.database import check_db_health, get_db_stats
 from app.core.config import settings
 
 router = APIRouter()
 
 
+def _ttl_cached(ttl: float):
+    """
+    Cache the latest result of a coroutine for `ttl` seconds.
+    A single slot is kept, reused only while called with the same arguments.
+    Concurrent callers on a miss share a single underlying call.
+    """
+    def decorator(func: Callable[..., Awaitable[Dict[str, Any]]]):
+        lock = asyncio.Lock()
+        state: Dict[str, Any] = {"args": None, "value": None, "expires": 0.0}
+
+        def fresh(args: tuple) -> bool:
+            return state["args"] == args and time.monotonic() < state["expires"]
+
+        @wraps(func)
+        async def wrapper(*args: Any) -> Dict[str, Any]:
+            if fresh(args):
+                return state["value"]
+            async with lock:
+                if not fresh(args):
+                    state["value"] = await func(*args)
+                    state["args"] = args
+                    state["expires"] = time.monotonic() + ttl
+            return state["value"]
+
+        return wrapper
+    return decorator
+
+
+# Probes and dashboards poll these aggressively; bursts share one DB round-trip
+_cached_db_health = _ttl_cached(1.0)(check_db_health)
+_cached_db_stats = _ttl_cached(5.0)(get_db_stats)
+
+
 @router.get("/health")
 async def health_check() -> Dict[str, Any]:
     """
@@ -29,26 +66,30 @@ async def health_check() -> Dict[str, Any]:
 
 
 @router.get("/health/detailed")
-async def detailed_health_check() -> Dict[str, Any]:
+async def detailed_health_check(request: Request) -> Dict[str, Any]:
     """
     Detailed health check with all dependencies.
     Includes database, cache, and system metrics.
     """
+    return await _detailed_health(getattr(request.app.state, "redis", None))
+
+
+@_ttl_cached(5.0)
+async def _detailed_health(redis_client: Optional[Redis]) -> Dict[str, Any]:
+    """Build the detailed health report (cached briefly for pollers)"""
     start_time = time.time()
     
     # Check database
-    db_health = await check_db_health()
+    db_health = await _cached_db_health()
     
-    # Check Redis (if configured)
+    # Check Redis (if configured); the client is created once at startup
     redis_health = {"status": "not_configured"}
     if settings.redis_host:
         try:
-            from app.cache.redis_client import RedisClient
-            # Try to ping Redis
-            client = RedisClient.get_client()
-            if client:
-                await client.ping()
-                redis_health = {"status": "healthy"}
+            if redis_client is None:
+                raise RuntimeError("Redis client not initialized")
+            await redis_client.ping()
+            redis_health = {"status": "healthy"}
         except Exception as e:
             redis_health = {"status": "unhealthy", "error": str(e)}
     
@@ -84,7 +125,7 @@ async def database_health() -> Dict[str, Any]:
     Database-specific health check.
     Returns detailed database connection information.
     """
-    return await check_db_health()
+    return await _cached_db_health()
 
 
 @router.get("/health/stats")
@@ -93,7 +134,7 @@ async def database_stats() -> Dict[str, Any]:
     Database statistics for monitoring.
     Returns table counts and other metrics.
     """
-    return await get_db_stats()
+    return await _cached_db_stats()
 
 
 @router.get("/health/ready")
@@ -102,7 +143,7 @@ async def readiness_check() -> Dict[str, Any]:
     Kubernetes readiness probe endpoint.
     Returns 200 only if service can handle requests.
     """
-    db_health = await check_db_health()
+    db_health = await _cached_db_health()
     
     if db_health["status"] == "healthy":
         return {"status": "ready"}
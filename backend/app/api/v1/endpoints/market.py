@@ -3,15 +3,37 @@ Market Data Endpoints
 Quotes, historical data, market status
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, time
 from typing import Annotated, Optional
+from zoneinfo import ZoneInfo
 
+import numpy as np
 from fastapi import APIRouter, Depends, Query
 
 from app.core import settings
 
 router = APIRouter()
 
+# NSE trading hours: 9:15 AM to 3:30 PM IST
+IST = ZoneInfo("Asia/Kolkata")
+MARKET_OPEN = time(9, 15)
+MARKET_CLOSE = time(15, 30)
+
+MAX_QUOTE_SYMBOLS = 200
+
+# Instrument master (in production, loaded from the broker)
+_INSTRUMENTS = (
+    {"symbol": "RELIANCE", "name": "Reliance Industries Ltd", "exchange": "NSE"},
+    {"symbol": "TCS", "name": "Tata Consultancy Services Ltd", "exchange": "NSE"},
+    {"symbol": "HDFC", "name": "HDFC Bank Ltd", "exchange": "NSE"},
+    {"symbol": "INFY", "name": "Infosys Ltd", "exchange": "NSE"},
+    {"symbol": "ICICI", "name": "ICICI Bank Ltd", "exchange": "NSE"},
+)
+
+# Search columns, uppercased once at import so searches only scan strings
+_SYMBOLS_UP = tuple(row["symbol"].upper() for row in _INSTRUMENTS)
+_NAMES_UP = tuple(row["name"].upper() for row in _INSTRUMENTS)
+
 
 @router.get("/quote/{symbol}")
 async def get_quote(symbol: str):
@@ -29,7 +51,7 @@ async def get_quote(symbol: str):
         "volume": 1500000,
         "bid": 1850.00,
         "ask": 1851.00,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.utcnow(),
     }
 
 
@@ -38,18 +60,23 @@ async def get_quotes(
     symbols: str = Query(..., description="Comma-separated list of symbols"),
 ):
     """Get quotes for multiple symbols"""
-    symbol_list = symbols.split(",")
+    # Trim, drop blanks and duplicates (keeping order), and bound the fan-out
+    symbol_list = list(dict.fromkeys(
+        symbol for symbol in (raw.strip() for raw in symbols.split(",")) if symbol
+    ))[:MAX_QUOTE_SYMBOLS]
     
     # In production, fetch from broker
-    quotes = []
-    for symbol in symbol_list:
-        quotes.append({
-            "symbol": symbol.strip(),
+    now = datetime.utcnow()
+    quotes = [
+        {
+            "symbol": symbol,
             "ltp": 1850.50 + (hash(symbol) % 100),
             "change": 15.50,
             "change_percent": 0.85,
-            "timestamp": datetime.utcnow().isoformat(),
-        })
+            "timestamp": now,
+        }
+        for symbol in symbol_list
+    ]
     
     return {"quotes": quotes}
 
@@ -62,27 +89,29 @@ async def get_historical_data(
 ):
     """Get historical OHLC data"""
     # In production, fetch from broker
-    candles = []
-    base_price = 1800
+    i = np.arange(days)
+    # Each candle opens off the previous close: open_i = close_{i-1} + i % 10
+    steps = (i % 10) + (i % 7 - 3)
+    opens = 1800 + np.concatenate(([0], np.cumsum(steps[:-1]))) + (i % 10)
+    closes = opens + (i % 7 - 3)
+    volumes = 1000000 + i * 10000
     
-    for i in range(days):
-        date = datetime.utcnow() - timedelta(days=days-i)
-        open_price = base_price + (i % 10)
-        high = open_price + 20
-        low = open_price - 15
-        close = open_price + (i % 7 - 3)
-        volume = 1000000 + (i * 10000)
-        
-        candles.append({
-            "timestamp": date.isoformat(),
-            "open": open_price,
-            "high": high,
-            "low": low,
-            "close": close,
-            "volume": volume,
-        })
-        
-        base_price = close
+    now = np.datetime64(datetime.utcnow(), "us")
+    timestamps = now - np.arange(days, 0, -1).astype("timedelta64[D]")
+    
+    candles = [
+        {
+            "timestamp": ts,
+            "open": o,
+            "high": o + 20,
+            "low": o - 15,
+            "close": c,
+            "volume": v,
+        }
+        for ts, o, c, v in zip(
+            timestamps.tolist(), opens.tolist(), closes.tolist(), volumes.tolist()
+        )
+    ]
     
     return {
         "symbol": symbol,
@@ -94,27 +123,16 @@ async def get_historical_data(
 @router.get("/status")
 async def get_market_status():
     """Get current market status"""
-    now = datetime.utcnow()
-    
-    # NSE trading hours: 9:15 AM to 3:30 PM IST
-    # Convert to UTC (IST = UTC+5:30)
-    
-    is_weekday = now.weekday() < 5
-    
-    # Simplified market status
-    status = "CLOSED"
-    if is_weekday:
-        # Check if within trading hours (simplified)
-        hour = (now.hour + 5) % 24  # Rough IST conversion
-        if 9 <= hour < 16:
-            status = "OPEN"
+    now = datetime.now(IST)
+    is_open = now.weekday() < 5 and MARKET_OPEN <= now.time() < MARKET_CLOSE
+    status = "OPEN" if is_open else "CLOSED"
     
     return {
         "exchange": "NSE",
         "status": status,
-        "timestamp": now.isoformat(),
-        "next_open": "09:15:00",
-        "next_close": "15:30:00",
+        "timestamp": now,
+        "next_open": MARKET_OPEN.isoformat(),
+        "next_close": MARKET_CLOSE.isoformat(),
         "trading_days": ["MON", "TUE", "WED", "THU", "FRI"],
     }
 
@@ -125,19 +143,13 @@ async def search_symbols(
     exchange: str = Query("NSE"),
 ):
     """Search for symbols"""
-    # In production, search from instrument master
-    results = [
-        {"symbol": "RELIANCE", "name": "Reliance Industries Ltd", "exchange": "NSE"},
-        {"symbol": "TCS", "name": "Tata Consultancy Services Ltd", "exchange": "NSE"},
-        {"symbol": "HDFC", "name": "HDFC Bank Ltd", "exchange": "NSE"},
-        {"symbol": "INFY", "name": "Infosys Ltd", "exchange": "NSE"},
-        {"symbol": "ICICI", "name": "ICICI Bank Ltd", "exchange": "NSE"},
+    query_up = query.upper()
+    hits = [
+        i for i, (sym, name) in enumerate(zip(_SYMBOLS_UP, _NAMES_UP))
+        if query_up in sym or query_up in name
     ]
     
-    # Filter by query
-    filtered = [r for r in results if query.upper() in r["symbol"] or query.upper() in r["name"]]
-    
     return {
-        "results": filtered[:10],
-        "total": len(filtered),
+        "results": [_INSTRUMENTS[i] for i in hits[:10]],
+        "total": len(hits),
     }
@@ -7,28 +7,30 @@ from datetime import datetime
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, update, and_, desc, func, lambda_stmt, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core import get_db
-from app.models import User, Order, OrderStatus, OrderSide, OrderType, ProductType
+from app.models import (
+    User, Order, OrderStatus, OrderSide, OrderType, ProductType,
+    Position, PositionSide, PositionStatus,
+)
+from app.schemas import OrderCreate, OrderResponse, OrderListResponse
 from app.engines import risk_system, TradeRequest
 from app.api.v1.endpoints.auth import get_current_user
+from app.api.v1.pagination import decode_cursor, encode_cursor
 
 router = APIRouter()
 
+# Schema enum value -> model enum, for place_order
+_ORDER_SIDES = {e.value: e for e in OrderSide}
+_ORDER_TYPES = {e.value: e for e in OrderType}
+_PRODUCT_TYPES = {e.value: e for e in ProductType}
+
 
 @router.post("/place")
 async def place_order(
-    symbol: str,
-    side: str,  # BUY or SELL
-    quantity: int,
-    price: float = 0.0,
-    order_type: str = "MARKET",
-    product_type: str = "INTRADAY",
-    exchange: str = "NSE",
-    stop_loss: Optional[float] = None,
-    target: Optional[float] = None,
+    order_data: OrderCreate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -43,13 +45,14 @@ async def place_order(
     """
     # Create trade request for risk audit
     trade_request = TradeRequest(
-        symbol=symbol,
-        exchange=exchange,
-        side=side,
-        quantity=quantity,
-        price=price if price > 0 else 0,  # Market order
-        stop_loss=stop_loss,
-        target=target,
+        symbol=order_data.symbol,
+        exchange=order_data.exchange,
+        side=order_data.side.value,
+        quantity=order_data.quantity,
+        price=order_data.price,  # 0 for market orders
+        stop_loss=order_data.stop_loss,
+        target=order_data.target,
+        strategy=order_data.strategy,
     )
     
     # Run risk audit
@@ -64,22 +67,28 @@ async def place_order(
     # Create order record
     order = Order(
         user_id=current_user.id,
-        symbol=symbol,
-        exchange=exchange,
-        side=OrderSide.BUY if side == "BUY" else OrderSide.SELL,
-        order_type=OrderType.MARKET if order_type == "MARKET" else OrderType.LIMIT,
-        product_type=ProductType.INTRADAY if product_type == "INTRADAY" else ProductType.DELIVERY,
-        quantity=quantity,
-        price=price,
-        stop_loss=stop_loss,
+        signal_id=order_data.signal_id,
+        symbol=order_data.symbol,
+        exchange=order_data.exchange,
+        side=_ORDER_SIDES[order_data.side.value],
+        order_type=_ORDER_TYPES[order_data.order_type.value],
+        product_type=_PRODUCT_TYPES[order_data.product_type.value],
+        quantity=order_data.quantity,
+        price=order_data.price,
+        trigger_price=order_data.trigger_price,
+        stop_loss=order_data.stop_loss,
+        square_off=order_data.square_off,
+        trailing_sl=order_data.trailing_sl,
+        strategy=order_data.strategy,
         status=OrderStatus.PENDING,
         broker="ANGEL_ONE",
         order_time=datetime.utcnow(),
     )
     
+    # The session keeps attributes after commit (expire_on_commit=False)
+    # and the flush already assigned order.id, so no refresh is needed
     db.add(order)
     await db.commit()
-    await db.refresh(order)
     
     # In production, place order with broker here
     # broker_order = await angel_one.place_order(...)
@@ -96,55 +105,81 @@ async def place_order(
     }
 
 
-@router.get("/")
+@router.get("/", response_model=OrderListResponse)
 async def get_orders(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
     symbol: Optional[str] = None,
     status: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get user's orders with pagination"""
-    query = select(Order).where(Order.user_id == current_user.id)
+    """
+    Get user's orders, newest first
+    
+    Pass `next_cursor` back as `cursor` to seek to the next page; `page`
+    (OFFSET paging) is deprecated and kept for existing clients.
+    """
+    user_id = current_user.id
+    limit = page_size + 1  # One extra row tells us whether another page exists
     
+    # lambda_stmt caches the statement construction; only bound values vary per call
+    query = lambda_stmt(lambda: select(Order).where(Order.user_id == user_id))
     if symbol:
-        query = query.where(Order.symbol == symbol)
+        query += lambda q: q.where(Order.symbol == symbol)
     if status:
-        query = query.where(Order.status == status)
+        query += lambda q: q.where(Order.status == status)
     
-    # Count
-    count_query = select(Order.id).where(Order.user_id == current_user.id)
-    total_result = await db.execute(count_query)
-    total = len(total_result.all())
+    total = None
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query += lambda q: q.where(
+            tuple_(Order.created_at, Order.id) < tuple_(cursor_created_at, cursor_id)
+        )
+    else:
+        # Count (same filters as the page query)
+        count_query = select(func.count(Order.id)).where(Order.user_id == user_id)
+        if symbol:
+            count_query = count_query.where(Order.symbol == symbol)
+        if status:
+            count_query = count_query.where(Order.status == status)
+        total = (await db.execute(count_query)).scalar_one()
+        
+        offset = (page - 1) * page_size
+        query += lambda q: q.offset(offset)
     
-    # Paginate
-    query = query.order_by(desc(Order.created_at))
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    query += lambda q: q.order_by(desc(Order.created_at), desc(Order.id)).limit(limit)
     
     result = await db.execute(query)
     orders = result.scalars().all()
     
-    return {
-        "orders": orders,
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-    }
+    has_next = len(orders) > page_size
+    orders = orders[:page_size]
+    
+    return OrderListResponse(
+        orders=orders,
+        total=total,
+        page=None if cursor else page,
+        page_size=page_size,
+        has_next=has_next,
+        next_cursor=encode_cursor(orders[-1].created_at, orders[-1].id) if has_next else None,
+    )
 
 
-@router.get("/{order_id}")
+@router.get("/{order_id}", response_model=OrderResponse)
 async def get_order(
     order_id: int,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific order by ID"""
+    user_id = current_user.id
     result = await db.execute(
-        select(Order).where(and_(
+        lambda_stmt(lambda: select(Order).where(and_(
             Order.id == order_id,
-            Order.user_id == current_user.id
-        ))
+            Order.user_id == user_id
+        )))
     )
     order = result.scalar_one_or_none()
     
@@ -164,30 +199,40 @@ async def cancel_order(
     db: AsyncSession = Depends(get_db)
 ):
     """Cancel a pending order"""
+    # In production, cancel with broker here
+    # await angel_one.cancel_order(order.broker_order_id)
+    
+    # Check the state and transition in one atomic statement
     result = await db.execute(
-        select(Order).where(and_(
+        update(Order)
+        .where(and_(
             Order.id == order_id,
-            Order.user_id == current_user.id
+            Order.user_id == current_user.id,
+            Order.status.in_([OrderStatus.PENDING, OrderStatus.SUBMITTED])
         ))
+        .values(status=OrderStatus.CANCELLED)
+        .returning(Order.id)
+        .execution_options(synchronize_session=False)
     )
-    order = result.scalar_one_or_none()
     
-    if not order:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Order not found"
+    if result.scalar_one_or_none() is None:
+        # Nothing updated: tell "missing" apart from "not cancellable"
+        exists = await db.execute(
+            select(Order.id).where(and_(
+                Order.id == order_id,
+                Order.user_id == current_user.id
+            ))
         )
-    
-    if order.status not in [OrderStatus.PENDING, OrderStatus.SUBMITTED]:
+        if exists.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Order not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot cancel order in current status"
         )
     
-    # In production, cancel with broker here
-    # await angel_one.cancel_order(order.broker_order_id)
-    
-    order.status = OrderStatus.CANCELLED
     await db.commit()
     
     return {"message": "Order cancelled", "order_id": order_id}
@@ -201,18 +246,31 @@ async def square_off_position(
     db: AsyncSession = Depends(get_db)
 ):
     """Square off position for a symbol"""
-    # Get active position
-    from app.models import Position, PositionStatus
-    
-    result = await db.execute(
-        select(Position).where(and_(
+    # Close the open position and read back what the exit order needs in one
+    # statement; a concurrent square-off finds it no longer OPEN and gets 404
+    open_position_id = (
+        select(Position.id)
+        .where(and_(
             Position.user_id == current_user.id,
             Position.symbol == symbol,
             Position.exchange == exchange,
             Position.status == PositionStatus.OPEN
         ))
+        .limit(1)
+        .scalar_subquery()
+    )
+    now = datetime.utcnow()
+    result = await db.execute(
+        update(Position)
+        .where(and_(
+            Position.id == open_position_id,
+            Position.status == PositionStatus.OPEN
+        ))
+        .values(status=PositionStatus.CLOSED, exit_time=now)
+        .returning(Position.id, Position.side, Position.open_quantity)
+        .execution_options(synchronize_session=False)
     )
-    position = result.scalar_one_or_none()
+    position = result.first()
     
     if not position:
         raise HTTPException(
@@ -221,28 +279,21 @@ async def square_off_position(
         )
     
     # Create square-off order
-    side = "SELL" if position.side.value == "LONG" else "BUY"
-    
     order = Order(
         user_id=current_user.id,
         symbol=symbol,
         exchange=exchange,
-        side=OrderSide.SELL if side == "SELL" else OrderSide.BUY,
+        side=OrderSide.SELL if position.side == PositionSide.LONG else OrderSide.BUY,
         order_type=OrderType.MARKET,
         product_type=ProductType.INTRADAY,
         quantity=position.open_quantity,
         price=0,
         status=OrderStatus.PENDING,
         broker="ANGEL_ONE",
-        order_time=datetime.utcnow(),
+        order_time=now,
     )
     
     db.add(order)
-    
-    # Update position
-    position.status = PositionStatus.CLOSED
-    position.exit_time = datetime.utcnow()
-    
     await db.commit()
     
     return {
@@ -3,61 +3,162 @@ Portfolio Endpoints
 Holdings, positions, and P&L
 """
 
-from typing import Annotated, Optional
+from typing import Annotated, AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, and_, desc, func
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from loguru import logger
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, select, update, and_, desc, func
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.cache import CacheKeys, RedisClient
 from app.core import get_db
 from app.models import User, Position, PositionStatus
 from app.api.v1.endpoints.auth import get_current_user
 
 router = APIRouter()
 
+# Summaries are keyed on the positions watermark, so the TTL only bounds memory
+SUMMARY_CACHE_TTL = 60
+
+# Columns returned by the positions list and history, selected as plain rows.
+# Every mapped column, so the payload matches the full Position rows these
+# endpoints used to return
+_POSITION_COLUMNS = tuple(
+    getattr(Position, attr.key) for attr in Position.__mapper__.column_attrs
+)
+_POSITION_KEYS = tuple(column.key for column in _POSITION_COLUMNS)
+
+# Summary for a user with no open positions (the common case for new users)
+_EMPTY_SUMMARY = {
+    "total_positions": 0,
+    "total_investment": 0,
+    "current_value": 0,
+    "total_pnl": 0,
+    "unrealized_pnl": 0,
+    "realized_pnl": 0,
+    "pnl_percent": 0,
+    "sector_breakdown": {},
+}
+
+# Rows fetched per round trip while streaming the positions list
+POSITIONS_STREAM_CHUNK = 500
+
+_OPEN_POSITIONS = and_(
+    Position.user_id == bindparam("user_id"),
+    Position.status == PositionStatus.OPEN
+)
+_CURRENT_VALUE = Position.open_quantity * Position.current_price
+_SECTOR = func.coalesce(Position.sector, "OTHER")
+
+# Summary statements are built once; only the user_id parameter changes
+_POSITIONS_WATERMARK = select(
+    func.max(Position.updated_at), func.count(Position.id)
+).where(Position.user_id == bindparam("user_id"))
+_SUMMARY_TOTALS = select(
+    func.count(Position.id).label("count"),
+    func.coalesce(func.sum(Position.open_quantity * Position.entry_price), 0).label("investment"),
+    func.coalesce(func.sum(_CURRENT_VALUE), 0).label("current_value"),
+    func.coalesce(func.sum(Position.unrealized_pnl), 0).label("unrealized_pnl"),
+    func.coalesce(func.sum(Position.realized_pnl), 0).label("realized_pnl"),
+).where(_OPEN_POSITIONS)
+_SUMMARY_SECTORS = select(
+    _SECTOR.label("sector"),
+    func.sum(_CURRENT_VALUE).label("value"),
+    func.sum(Position.unrealized_pnl).label("pnl"),
+    func.count(Position.id).label("count"),
+).where(_OPEN_POSITIONS).group_by(_SECTOR)
+
+
+async def _stream_positions(query, bind: AsyncEngine) -> AsyncIterator[bytes]:
+    """Encode the positions list as JSON one fetched chunk at a time"""
+    total = 0
+    yield b'{"positions":['
+    # get_db's session is closed before the body is sent, so stream on a
+    # session of our own against the same engine
+    async with AsyncSession(bind, expire_on_commit=False) as session:
+        result = await session.stream(
+            query.execution_options(yield_per=POSITIONS_STREAM_CHUNK)
+        )
+        async for partition in result.mappings().partitions():
+            chunk = b",".join(orjson.dumps(dict(row)) for row in partition)
+            yield (b"," if total else b"") + chunk
+            total += len(partition)
+    yield b'],"total":%d}' % total
+
+
+async def _positions_watermark(db: AsyncSession, user_id: int) -> str:
+    """Version of a user's positions: changes whenever any position is written"""
+    result = await db.execute(_POSITIONS_WATERMARK, {"user_id": user_id})
+    updated_at, count = result.one()
+    return f"{updated_at.timestamp() if updated_at else 0}:{count}"
+
+
+async def _compute_portfolio_summary(db: AsyncSession, user_id: int) -> dict:
+    """Aggregate a user's open positions into the summary payload"""
+    params = {"user_id": user_id}
+    
+    # Totals over open positions, aggregated in the database
+    totals = (await db.execute(_SUMMARY_TOTALS, params)).one()
+    if totals.count == 0:
+        # No open positions: nothing to break down by sector
+        return _EMPTY_SUMMARY
+    
+    # total_pnl is a Python property (realized + unrealized), not a column
+    total_pnl = totals.realized_pnl + totals.unrealized_pnl
+    
+    # Sector breakdown
+    result = await db.execute(_SUMMARY_SECTORS, params)
+    sectors = {
+        row.sector: {"value": row.value, "pnl": row.pnl, "count": row.count}
+        for row in result
+    }
+    
+    return {
+        "total_positions": totals.count,
+        "total_investment": totals.investment,
+        "current_value": totals.current_value,
+        "total_pnl": total_pnl,
+        "unrealized_pnl": totals.unrealized_pnl,
+        "realized_pnl": totals.realized_pnl,
+        "pnl_percent": (total_pnl / totals.investment * 100) if totals.investment > 0 else 0,
+        "sector_breakdown": sectors,
+    }
+
 
 @router.get("/summary")
 async def get_portfolio_summary(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get portfolio summary"""
-    # Get all open positions
-    result = await db.execute(
-        select(Position).where(and_(
-            Position.user_id == current_user.id,
-            Position.status == PositionStatus.OPEN
-        ))
-    )
-    positions = result.scalars().all()
+    if getattr(request.app.state, "redis", None) is None:
+        return await _compute_portfolio_summary(db, current_user.id)
     
-    # Calculate summary
-    total_investment = sum(p.open_quantity * p.entry_price for p in positions)
-    total_current_value = sum(p.open_quantity * p.current_price for p in positions)
-    total_pnl = sum(p.total_pnl for p in positions)
-    total_unrealized = sum(p.unrealized_pnl for p in positions)
-    total_realized = sum(p.realized_pnl for p in positions)
+    key = CacheKeys.PORTFOLIO_SUMMARY.format(
+        user_id=current_user.id,
+        watermark=await _positions_watermark(db, current_user.id),
+    )
     
-    # Sector breakdown
-    sectors = {}
-    for p in positions:
-        sector = p.sector or "OTHER"
-        if sector not in sectors:
-            sectors[sector] = {"value": 0, "pnl": 0, "count": 0}
-        sectors[sector]["value"] += p.open_quantity * p.current_price
-        sectors[sector]["pnl"] += p.unrealized_pnl
-        sectors[sector]["count"] += 1
+    # The cache fails open: a Redis outage must not fail the endpoint
+    try:
+        cached = await RedisClient.get(key)
+    except RedisError as e:
+        logger.warning(f"Portfolio summary cache read failed: {e}")
+        return await _compute_portfolio_summary(db, current_user.id)
+    if cached is not None:
+        return cached
     
-    return {
-        "total_positions": len(positions),
-        "total_investment": total_investment,
-        "current_value": total_current_value,
-        "total_pnl": total_pnl,
-        "unrealized_pnl": total_unrealized,
-        "realized_pnl": total_realized,
-        "pnl_percent": (total_pnl / total_investment * 100) if total_investment > 0 else 0,
-        "sector_breakdown": sectors,
-    }
+    summary = await _compute_portfolio_summary(db, current_user.id)
+    try:
+        await RedisClient.set(key, summary, ttl=SUMMARY_CACHE_TTL)
+    except RedisError as e:
+        logger.warning(f"Portfolio summary cache write failed: {e}")
+    return summary
 
 
 @router.get("/positions")
@@ -67,7 +168,8 @@ async def get_positions(
     db: AsyncSession = Depends(get_db)
 ):
     """Get user's positions"""
-    query = select(Position).where(Position.user_id == current_user.id)
+    # Columns-only select: rows skip ORM hydration and the identity map
+    query = select(*_POSITION_COLUMNS).where(Position.user_id == current_user.id)
     
     if status == "OPEN":
         query = query.where(Position.status == PositionStatus.OPEN)
@@ -76,13 +178,9 @@ async def get_positions(
     
     query = query.order_by(desc(Position.created_at))
     
-    result = await db.execute(query)
-    positions = result.scalars().all()
-    
-    return {
-        "positions": positions,
-        "total": len(positions),
-    }
+    # Rows are plain values encoded by orjson as they arrive, so memory stays
+    # bounded by one chunk and the first bytes go out before the last row is read
+    return StreamingResponse(_stream_positions(query, db.bind), media_type="application/json")
 
 
 @router.get("/positions/{position_id}")
@@ -92,15 +190,10 @@ async def get_position(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific position"""
-    result = await db.execute(
-        select(Position).where(and_(
-            Position.id == position_id,
-            Position.user_id == current_user.id
-        ))
-    )
-    position = result.scalar_one_or_none()
+    # Primary-key lookup (identity map first); ownership is checked in Python
+    position = await db.get(Position, position_id)
     
-    if not position:
+    if not position or position.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Position not found")
     
     return position
@@ -114,19 +207,22 @@ async def update_stop_loss(
     db: AsyncSession = Depends(get_db)
 ):
     """Update stop loss for a position"""
+    # Check ownership and state and write in one statement
     result = await db.execute(
-        select(Position).where(and_(
+        update(Position)
+        .where(and_(
             Position.id == position_id,
             Position.user_id == current_user.id,
             Position.status == PositionStatus.OPEN
         ))
+        .values(stop_loss=stop_loss)
+        .returning(Position.id)
+        .execution_options(synchronize_session=False)
     )
-    position = result.scalar_one_or_none()
     
-    if not position:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Position not found")
     
-    position.stop_loss = stop_loss
     await db.commit()
     
     return {"message": "Stop loss updated", "stop_loss": stop_loss}
@@ -140,29 +236,36 @@ async def get_trade_history(
     db: AsyncSession = Depends(get_db)
 ):
     """Get closed positions history"""
-    query = select(Position).where(and_(
+    filters = (
         Position.user_id == current_user.id,
-        Position.status == PositionStatus.CLOSED
-    ))
+        Position.status == PositionStatus.CLOSED,
+    )
     
-    # Count
-    count_query = select(func.count(Position.id)).where(and_(
-        Position.user_id == current_user.id,
-        Position.status == PositionStatus.CLOSED
-    ))
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Page rows carry the total via COUNT(*) OVER (), so one round trip
+    # returns both
+    query = (
+        select(*_POSITION_COLUMNS, func.count().over().label("total_count"))
+        .where(*filters)
+        .order_by(desc(Position.exit_time))
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )
     
-    # Paginate
-    query = query.order_by(desc(Position.exit_time))
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    rows = (await db.execute(query)).mappings().all()
+    positions = [{key: row[key] for key in _POSITION_KEYS} for row in rows]
     
-    result = await db.execute(query)
-    positions = result.scalars().all()
+    if rows:
+        total = rows[0]["total_count"]
+    elif page == 1:
+        total = 0
+    else:
+        # Past the last page there are no rows to carry the total
+        count_query = select(func.count(Position.id)).where(*filters)
+        total = (await db.execute(count_query)).scalar_one()
     
-    return {
+    return ORJSONResponse({
         "trades": positions,
         "total": total,
         "page": page,
         "page_size": page_size,
-    }
+    })
@@ -3,22 +3,46 @@ Signal Endpoints
 AI signal generation and management
 """
 
+import asyncio
 from datetime import datetime
 from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, and_, desc
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from loguru import logger
+from sqlalchemy import select, update, and_, desc, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.core import get_db, settings
 from app.models import User, Signal, SignalAction, SignalStatus
-from app.schemas import SignalCreate, SignalResponse, SignalListResponse
+from app.schemas import SignalBatchResponse, SignalCreate, SignalResponse, SignalListResponse
 from app.services.signal_service_smc import signal_service_smc
 from app.websocket.manager import signal_manager
 from app.api.v1.endpoints.auth import get_current_user
+from app.api.v1.pagination import decode_cursor, encode_cursor
 
 router = APIRouter()
 
+# Upper bound on symbols per batch generation request
+MAX_BATCH_SYMBOLS = 50
+
+# Extended targets as multiples of the SMC target price (conservative, aggressive)
+TARGET_2_MULTIPLIER = 1.5
+TARGET_3_MULTIPLIER = 2.0
+
+# SMC direction -> signal action, and SMC risk level -> confidence level
+_DIRECTION_TO_ACTION = {"LONG": SignalAction.BUY, "SHORT": SignalAction.SELL}
+_RISK_TO_CONFIDENCE = {"LOW": "HIGH", "MEDIUM": "MEDIUM"}
+
+# SMC result fields that contribute to a signal's reasoning, in display order
+_REASON_MAP = (
+    ("market_structure", "Structure: {}"),
+    ("liquidity_sweep", "Liquidity Sweep detected"),
+    ("order_block", "Order Block formed"),
+    ("fvg", "Fair Value Gap present"),
+    ("mtf_confirmation", "MTF confirmation"),
+)
+
 
 # ==================== HELPER ====================
 
@@ -36,10 +60,88 @@ async def get_active_user_signals(
         ))
         .order_by(desc(Signal.created_at))
         .limit(limit)
+        .options(raiseload("*"))
     )
     return result.scalars().all()
 
 
+def _signal_from_smc(smc_result: dict, user_id: int, symbol: str, exchange: str) -> Signal:
+    """Build a Signal row from an SMC service result"""
+    # Map SMC direction to action
+    direction = smc_result["direction"]
+    action = _DIRECTION_TO_ACTION.get(direction, SignalAction.HOLD)
+
+    # Map risk level to confidence level (HIGH or unknown risk -> LOW confidence)
+    risk_level = smc_result.get("risk_level", "MEDIUM")
+    confidence_level = _RISK_TO_CONFIDENCE.get(risk_level, "LOW")
+
+    # Create reasoning string
+    reasoning = "; ".join(
+        label.format(smc_result[key])
+        for key, label in _REASON_MAP
+        if smc_result.get(key)
+    ) or "SMC setup detected"
+
+    # Create signal record
+    target_price = smc_result["target_price"]
+    return Signal(
+        user_id=user_id,
+        trace_id=smc_result["trace_id"],
+        symbol=symbol,
+        exchange=exchange,
+        action=action,
+        direction=direction,
+        status=SignalStatus.ACTIVE if smc_result.get("approved", True) else SignalStatus.PENDING,
+        probability=smc_result["quality_score"],  # Map quality score to probability
+        confidence=smc_result["quality_score"],
+        confidence_level=confidence_level,
+        risk_level=risk_level,
+        entry_price=smc_result["entry_price"],
+        stop_loss=smc_result["stop_loss"],
+        target_1=target_price,
+        target_2=target_price * TARGET_2_MULTIPLIER,
+        target_3=target_price * TARGET_3_MULTIPLIER,
+        strategy="SMC",
+        market_regime="TRENDING",  # SMC works best in trending markets
+        # Signal Versioning
+        setup_version=smc_result.get("setup_version", "1.0"),
+        # SMC-specific fields
+        market_structure=smc_result.get("market_structure"),
+        liquidity_sweep=smc_result.get("liquidity_sweep"),
+        order_block=smc_result.get("order_block"),
+        fair_value_gap=smc_result.get("fvg"),
+        mtf_confirmation=smc_result.get("mtf_confirmation", False),
+        evidence_count=1,  # SMC is rule-based, not evidence-based
+        reasoning=reasoning,
+        signal_time=datetime.fromisoformat(smc_result["signal_time"]),
+    )
+
+
+def _signal_broadcast_payload(signal: Signal) -> dict:
+    """WebSocket payload for a newly generated signal"""
+    return {
+        "id": signal.id,
+        "symbol": signal.symbol,
+        "exchange": signal.exchange,
+        "action": signal.action.value,
+        "direction": signal.direction,
+        "quality_score": signal.probability,
+        "strategy": signal.strategy,
+        "entry_price": signal.entry_price,
+        "stop_loss": signal.stop_loss,
+        "target_price": signal.target_1,
+        "risk_reward_ratio": signal.target_1 / abs(signal.entry_price - signal.stop_loss) if signal.stop_loss else 0,
+        "trace_id": signal.trace_id,
+        "market_structure": signal.market_structure,
+        "liquidity_sweep": signal.liquidity_sweep,
+        "order_block": signal.order_block,
+        "fvg": signal.fair_value_gap,
+        "mtf_confirmation": signal.mtf_confirmation,
+        "reasoning": signal.reasoning,
+        "signal_time": signal.signal_time.isoformat(),
+    }
+
+
 # ==================== ENDPOINTS ====================
 
 @router.post("/generate", response_model=SignalResponse)
@@ -88,101 +190,16 @@ async def generate_signal(
                 detail=smc_result.get("reason", "No valid SMC setup found")
             )
 
-        # Map SMC direction to action
-        direction = smc_result["direction"]
-        if direction == "LONG":
-            action = SignalAction.BUY
-        elif direction == "SHORT":
-            action = SignalAction.SELL
-        else:
-            action = SignalAction.HOLD
-
-        # Map risk level to confidence level
-        risk_level = smc_result.get("risk_level", "MEDIUM")
-        if risk_level == "LOW":
-            confidence_level = "HIGH"
-        elif risk_level == "MEDIUM":
-            confidence_level = "MEDIUM"
-        else:
-            confidence_level = "LOW"
-
-        # Create reasoning string
-        reasoning_parts = []
-        if smc_result.get("market_structure"):
-            reasoning_parts.append(f"Structure: {smc_result['market_structure']}")
-        if smc_result.get("liquidity_sweep"):
-            reasoning_parts.append("Liquidity Sweep detected")
-        if smc_result.get("order_block"):
-            reasoning_parts.append("Order Block formed")
-        if smc_result.get("fvg"):
-            reasoning_parts.append("Fair Value Gap present")
-        if smc_result.get("mtf_confirmation"):
-            reasoning_parts.append("MTF confirmation")
-        reasoning = "; ".join(reasoning_parts) if reasoning_parts else "SMC setup detected"
-
-        # Create signal record
-        signal = Signal(
-            user_id=current_user.id,
-            trace_id=smc_result["trace_id"],
-            symbol=symbol,
-            exchange=exchange,
-            action=action,
-            direction=direction,
-            status=SignalStatus.ACTIVE if smc_result.get("approved", True) else SignalStatus.PENDING,
-            probability=smc_result["quality_score"],  # Map quality score to probability
-            confidence=smc_result["quality_score"],
-            confidence_level=confidence_level,
-            risk_level=risk_level,
-            entry_price=smc_result["entry_price"],
-            stop_loss=smc_result["stop_loss"],
-            target_1=smc_result["target_price"],
-            target_2=smc_result["target_price"] * 1.5,  # Conservative target
-            target_3=smc_result["target_price"] * 2.0,  # Aggressive target
-            strategy="SMC",
-            market_regime="TRENDING",  # SMC works best in trending markets
-            # Signal Versioning
-            setup_version=smc_result.get("setup_version", "1.0"),
-            # SMC-specific fields
-            market_structure=smc_result.get("market_structure"),
-            liquidity_sweep=smc_result.get("liquidity_sweep"),
-            order_block=smc_result.get("order_block"),
-            fair_value_gap=smc_result.get("fvg"),
-            mtf_confirmation=smc_result.get("mtf_confirmation", False),
-            evidence_count=1,  # SMC is rule-based, not evidence-based
-            reasoning=reasoning,
-            signal_time=datetime.fromisoformat(smc_result["signal_time"]),
-        )
+        signal = _signal_from_smc(smc_result, current_user.id, symbol, exchange)
 
         db.add(signal)
         await db.commit()
-        await db.refresh(signal)
 
         # Broadcast signal to WebSocket clients
-        signal_data = {
-            "id": signal.id,
-            "symbol": signal.symbol,
-            "exchange": signal.exchange,
-            "action": signal.action.value,
-            "direction": signal.direction,
-            "quality_score": signal.probability,
-            "strategy": signal.strategy,
-            "entry_price": signal.entry_price,
-            "stop_loss": signal.stop_loss,
-            "target_price": signal.target_1,
-            "risk_reward_ratio": signal.target_1 / abs(signal.entry_price - signal.stop_loss) if signal.stop_loss else 0,
-            "trace_id": signal.trace_id,
-            "market_structure": signal.market_structure,
-            "liquidity_sweep": signal.liquidity_sweep,
-            "order_block": signal.order_block,
-            "fvg": signal.fair_value_gap,
-            "mtf_confirmation": signal.mtf_confirmation,
-            "reasoning": signal.reasoning,
-            "signal_time": signal.signal_time.isoformat(),
-        }
-
-        # Broadcast asynchronously (don't wait for it)
-        import asyncio
-        asyncio.create_task(signal_manager.broadcast_signal(signal_data))
+        signal_data = _signal_broadcast_payload(signal)
+
+        # Only queues the message per client; sockets are written by sender tasks
+        await signal_manager.broadcast_signal(signal_data)
 
         return signal
 
@@ -193,43 +210,141 @@ async def generate_signal(
         )
 
 
+@router.post("/generate/batch", response_model=SignalBatchResponse)
+async def generate_signals_batch(
+    symbols: List[str] = Body(..., description="Symbols to analyse"),
+    exchange: str = "NSE",
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Generate SMC signals for several symbols in one request
+
+    Symbols are analysed concurrently and every resulting signal is inserted
+    in a single transaction. Symbols without a valid setup (HOLD) or beyond
+    MAX_BATCH_SYMBOLS are reported as skipped, and symbols whose analysis
+    raised are reported as failed.
+    """
+    # Trim, drop blanks and duplicates (keeping order), and bound the fan-out
+    unique_symbols = list(dict.fromkeys(
+        symbol for symbol in (raw.strip() for raw in symbols) if symbol
+    ))
+    symbol_list = unique_symbols[:MAX_BATCH_SYMBOLS]
+    skipped = unique_symbols[MAX_BATCH_SYMBOLS:]
+    failed = []
+
+    async def analyse(symbol: str) -> dict:
+        ltf_timeframe, htf_timeframe = settings.get_smc_timeframes_for_symbol(symbol)
+        return await signal_service_smc.generate_signal(
+            symbol=symbol,
+            exchange=exchange,
+            ltf_timeframe=ltf_timeframe,
+            htf_timeframe=htf_timeframe
+        )
+
+    results = await asyncio.gather(
+        *(analyse(symbol) for symbol in symbol_list),
+        return_exceptions=True
+    )
+
+    signals = []
+    for symbol, smc_result in zip(symbol_list, results):
+        if isinstance(smc_result, BaseException):
+            logger.opt(exception=smc_result).error(
+                f"Batch SMC signal generation failed for {symbol}"
+            )
+            failed.append(symbol)
+        elif smc_result.get("action") == "HOLD":
+            skipped.append(symbol)
+        else:
+            signals.append(_signal_from_smc(smc_result, current_user.id, symbol, exchange))
+
+    if signals:
+        # One flush inserts every row; eager_defaults returns ids and timestamps
+        db.add_all(signals)
+        await db.commit()
+
+        for signal in signals:
+            await signal_manager.broadcast_signal(_signal_broadcast_payload(signal))
+
+    return {"signals": signals, "skipped": skipped, "failed": failed}
+
+
 @router.get("/", response_model=SignalListResponse)
 async def get_signals(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
     symbol: Optional[str] = None,
     action: Optional[str] = None,
     status: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get user's signals with pagination and filtering"""
-    query = select(Signal).where(Signal.user_id == current_user.id)
+    """
+    Get user's signals with pagination and filtering, newest first
     
+    Pass `next_cursor` back as `cursor` to seek to the next page; `page`
+    (OFFSET paging) is kept for existing clients.
+    """
+    filters = [Signal.user_id == current_user.id]
     if symbol:
-        query = query.where(Signal.symbol == symbol)
+        filters.append(Signal.symbol == symbol)
     if action:
-        query = query.where(Signal.action == action)
+        filters.append(Signal.action == action)
     if status:
-        query = query.where(Signal.status == status)
-    
-    # Count total
-    count_query = select(Signal.id).where(Signal.user_id == current_user.id)
-    total_result = await db.execute(count_query)
-    total = len(total_result.all())
+        filters.append(Signal.status == status)
     
-    # Paginate
-    query = query.order_by(desc(Signal.created_at))
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    order_by = (desc(Signal.created_at), desc(Signal.id))
     
-    result = await db.execute(query)
-    signals = result.scalars().all()
+    if cursor:
+        # Keyset page: seek past the cursor row; cost does not grow with depth
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query = (
+            select(Signal)
+            .where(*filters)
+            .where(tuple_(Signal.created_at, Signal.id) < tuple_(cursor_created_at, cursor_id))
+            .order_by(*order_by)
+            .limit(page_size + 1)  # One extra row tells us whether another page exists
+            .options(raiseload("*"))
+        )
+        signals = (await db.execute(query)).scalars().all()
+        has_next = len(signals) > page_size
+        signals = signals[:page_size]
+        total = None
+    else:
+        # Page rows carry the filtered total via COUNT(*) OVER (), so one round trip
+        # returns both
+        query = (
+            select(Signal, func.count().over().label("total_count"))
+            .where(*filters)
+            .order_by(*order_by)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            # Serialization must not lazy-load relationships row by row
+            .options(raiseload("*"))
+        )
+        
+        rows = (await db.execute(query)).all()
+        signals = [row[0] for row in rows]
+        
+        if rows:
+            total = rows[0].total_count
+        elif page == 1:
+            total = 0
+        else:
+            # Past the last page there are no rows to carry the total
+            count_query = select(func.count(Signal.id)).where(*filters)
+            total = (await db.execute(count_query)).scalar_one()
+        has_next = (page * page_size) < total
     
     return SignalListResponse(
         signals=signals,
         total=total,
-        page=page,
+        page=None if cursor else page,
         page_size=page_size,
+        has_next=has_next,
+        next_cursor=encode_cursor(signals[-1].created_at, signals[-1].id) if has_next else None,
     )
 
 
@@ -240,15 +355,10 @@ async def get_signal(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific signal by ID"""
-    result = await db.execute(
-        select(Signal).where(and_(
-            Signal.id == signal_id,
-            Signal.user_id == current_user.id
-        ))
-    )
-    signal = result.scalar_one_or_none()
+    # Primary-key lookup (identity map first); ownership is checked in Python
+    signal = await db.get(Signal, signal_id)
     
-    if not signal:
+    if not signal or signal.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Signal not found"
@@ -264,27 +374,32 @@ async def cancel_signal(
     db: AsyncSession = Depends(get_db)
 ):
     """Cancel an active signal"""
+    # Check the state and transition in one atomic statement
     result = await db.execute(
-        select(Signal).where(and_(
+        update(Signal)
+        .where(and_(
             Signal.id == signal_id,
-            Signal.user_id == current_user.id
+            Signal.user_id == current_user.id,
+            Signal.status == SignalStatus.ACTIVE
         ))
+        .values(status=SignalStatus.CANCELLED)
+        .returning(Signal.id)
+        .execution_options(synchronize_session=False)
     )
-    signal = result.scalar_one_or_none()
     
-    if not signal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Signal not found"
-        )
-    
-    if signal.status != SignalStatus.ACTIVE:
+    if result.scalar_one_or_none() is None:
+        # Nothing updated: tell "missing" apart from "not active"
+        signal = await db.get(Signal, signal_id)
+        if not signal or signal.user_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Signal not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot cancel non-active signal"
         )
     
-    signal.status = SignalStatus.CANCELLED
     await db.commit()
     
     return {"message": "Signal cancelled", "signal_id": signal_id}
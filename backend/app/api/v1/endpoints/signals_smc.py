@@ -7,8 +7,9 @@ from datetime import datetime
 from typing import Annotated, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, and_, desc, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.core import get_db
 from app.models import User, Signal, SignalAction, SignalStatus
@@ -162,31 +163,29 @@ async def get_smc_signals(
     db: AsyncSession = Depends(get_db)
 ):
     """Get user's SMC signals with pagination and filtering"""
-    query = select(Signal).where(
-        and_(
-            Signal.user_id == current_user.id,
-            Signal.strategy == "SMC"  # Filter for SMC signals only
-        )
-    )
-
+    # Page and count share one predicate list so the total matches the filters
+    filters = [
+        Signal.user_id == current_user.id,
+        Signal.strategy == "SMC",  # Filter for SMC signals only
+    ]
     if symbol:
-        query = query.where(Signal.symbol == symbol)
+        filters.append(Signal.symbol == symbol)
     if status:
-        query = query.where(Signal.status == status)
+        filters.append(Signal.status == status)
 
-    # Count total
-    count_query = select(Signal.id).where(
-        and_(
-            Signal.user_id == current_user.id,
-            Signal.strategy == "SMC"
-        )
-    )
-    total_result = await db.execute(count_query)
-    total = len(total_result.all())
+    # Count total in the database rather than fetching every id
+    total = await db.scalar(select(func.count(Signal.id)).where(*filters)) or 0
 
     # Paginate
-    query = query.order_by(desc(Signal.created_at))
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    query = (
+        select(Signal)
+        .where(*filters)
+        .order_by(desc(Signal.created_at))
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        # Serialization must not lazy-load relationships row by row
+        .options(raiseload("*"))
+    )
 
     result = await db.execute(query)
     signals = result.scalars().all()
@@ -206,18 +205,27 @@ async def get_smc_stats(
     db: AsyncSession = Depends(get_db)
 ):
     """Get SMC signal statistics"""
-    # Get all SMC signals for user
+    smc_filter = and_(
+        Signal.user_id == current_user.id,
+        Signal.strategy == "SMC"
+    )
+
+    # Aggregate counts and averages in a single query
     result = await db.execute(
-        select(Signal).where(
-            and_(
-                Signal.user_id == current_user.id,
-                Signal.strategy == "SMC"
-            )
-        )
+        select(
+            func.count(Signal.id).label("total"),
+            func.sum(case((Signal.status == SignalStatus.ACTIVE, 1), else_=0)).label("active"),
+            func.sum(case((Signal.status == SignalStatus.HIT_TARGET, 1), else_=0)).label("hit_target"),
+            func.sum(case((Signal.status == SignalStatus.STOPPED_OUT, 1), else_=0)).label("stopped_out"),
+            func.sum(case((Signal.status == SignalStatus.EXPIRED, 1), else_=0)).label("expired"),
+            func.avg(Signal.probability).label("avg_probability"),
+            func.avg(Signal.confidence).label("avg_confidence"),
+        ).where(smc_filter)
     )
-    signals = result.scalars().all()
+    stats = result.one()
+    total = stats.total or 0
 
-    if not signals:
+    if total == 0:
         return SignalStatsResponse(
             total=0,
             active=0,
@@ -231,35 +239,26 @@ async def get_smc_stats(
             by_symbol={}
         )
 
-    # Calculate stats
-    total = len(signals)
-    active = sum(1 for s in signals if s.status == SignalStatus.ACTIVE)
-    hit_target = sum(1 for s in signals if s.status == SignalStatus.HIT_TARGET)
-    stopped_out = sum(1 for s in signals if s.status == SignalStatus.STOPPED_OUT)
-    expired = sum(1 for s in signals if s.status == SignalStatus.EXPIRED)
-
-    win_rate = (hit_target / total) if total > 0 else 0.0
-    avg_probability = sum(s.probability for s in signals) / total
-    avg_confidence = sum(s.confidence for s in signals) / total
-
-    # Group by strategy (should all be SMC)
-    by_strategy = {"SMC": total}
+    win_rate = stats.hit_target / total
 
     # Group by symbol
-    by_symbol = {}
-    for signal in signals:
-        by_symbol[signal.symbol] = by_symbol.get(signal.symbol, 0) + 1
+    result = await db.execute(
+        select(Signal.symbol, func.count(Signal.id))
+        .where(smc_filter)
+        .group_by(Signal.symbol)
+    )
+    by_symbol = {symbol: count for symbol, count in result.all()}
 
     return SignalStatsResponse(
         total=total,
-        active=active,
-        hit_target=hit_target,
-        stopped_out=stopped_out,
-        expired=expired,
+        active=stats.active,
+        hit_target=stats.hit_target,
+        stopped_out=stats.stopped_out,
+        expired=stats.expired,
         win_rate=round(win_rate, 3),
-        avg_probability=round(avg_probability, 3),
-        avg_confidence=round(avg_confidence, 3),
-        by_strategy=by_strategy,
+        avg_probability=round(stats.avg_probability or 0.0, 3),
+        avg_confidence=round(stats.avg_confidence or 0.0, 3),
+        by_strategy={"SMC": total},
         by_symbol=by_symbol
     )
 
@@ -278,7 +277,7 @@ async def get_smc_analytics(
                     Signal.user_id == current_user.id,
                     Signal.strategy == "SMC"
                 )
-            )
+            ).options(raiseload("*"))
         )
         signals = result.scalars().all()
 
@@ -304,34 +303,47 @@ async def get_smc_analytics(
                 monthly_performance={}
             )
 
-        # Calculate performance metrics
+        # Calculate performance metrics in a single pass
         total_signals = len(signals)
-        active_signals = sum(1 for s in signals if s.status == SignalStatus.ACTIVE)
-        completed_signals = total_signals - active_signals
-
-        winning_signals = [s for s in signals if s.status == SignalStatus.HIT_TARGET]
-        losing_signals = [s for s in signals if s.status == SignalStatus.STOPPED_OUT]
+        active_signals = win_count = loss_count = 0
+        total_wins = total_losses = 0.0
+        rr_sum = 0.0
+        rr_count = 0
+        holding_sum = 0
+        holding_count = 0
+
+        for s in signals:
+            if s.status == SignalStatus.ACTIVE:
+                active_signals += 1
+            elif s.status == SignalStatus.HIT_TARGET:
+                win_count += 1
+                if s.realized_pnl:
+                    total_wins += s.realized_pnl
+            elif s.status == SignalStatus.STOPPED_OUT:
+                loss_count += 1
+                if s.realized_pnl:
+                    total_losses += abs(s.realized_pnl)
+
+            rr = s.risk_reward_ratio
+            if rr:
+                rr_sum += rr
+                rr_count += 1
+
+            if s.holding_period_days:
+                holding_sum += s.holding_period_days
+                holding_count += 1
 
-        win_count = len(winning_signals)
-        loss_count = len(losing_signals)
+        completed_signals = total_signals - active_signals
         win_rate = (win_count / completed_signals) if completed_signals > 0 else 0.0
 
-        # Calculate average win/loss rates
-        avg_win_rate = sum(s.realized_pnl for s in winning_signals if s.realized_pnl) / win_count if win_count > 0 else 0.0
-        avg_loss_rate = sum(abs(s.realized_pnl) for s in losing_signals if s.realized_pnl) / loss_count if loss_count > 0 else 0.0
-
-        # Profit factor
-        total_wins = sum(s.realized_pnl for s in winning_signals if s.realized_pnl)
-        total_losses = sum(abs(s.realized_pnl) for s in losing_signals if s.realized_pnl)
+        # Average win/loss rates and profit factor
+        avg_win_rate = total_wins / win_count if win_count > 0 else 0.0
+        avg_loss_rate = total_losses / loss_count if loss_count > 0 else 0.0
         profit_factor = total_wins / total_losses if total_losses > 0 else float('inf')
 
-        # Average RR ratio
-        rr_ratios = [s.risk_reward_ratio for s in signals if s.risk_reward_ratio]
-        avg_rr_ratio = sum(rr_ratios) / len(rr_ratios) if rr_ratios else 0.0
-
-        # Average holding period
-        holding_periods = [s.holding_period_days for s in signals if s.holding_period_days]
-        avg_holding_period = sum(holding_periods) / len(holding_periods) if holding_periods else 0.0
+        # Average RR ratio and holding period
+        avg_rr_ratio = rr_sum / rr_count if rr_count else 0.0
+        avg_holding_period = holding_sum / holding_count if holding_count else 0.0
 
         # Setup performance analysis
         setup_performance = []
@@ -422,11 +434,11 @@ async def get_smc_analytics(
         # Convert to required format
         monthly_formatted = {}
         for month, data in monthly_performance.items():
-            total = data["total"]
-            win_rate = data["wins"] / total if total > 0 else 0.0
+            month_total = data["total"]
+            month_win_rate = data["wins"] / month_total if month_total > 0 else 0.0
             monthly_formatted[month] = {
-                "win_rate": round(win_rate, 3),
-                "total_signals": total,
+                "win_rate": round(month_win_rate, 3),
+                "total_signals": month_total,
                 "pnl": round(data["pnl"], 2)
             }
 
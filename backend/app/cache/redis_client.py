@@ -8,8 +8,10 @@ from typing import Any, Dict, Optional, Union
 from datetime import timedelta
 
 import redis.asyncio as redis
+from loguru import logger
 from redis.asyncio import Redis
 from redis.asyncio.connection import ConnectionPool
+from redis.exceptions import RedisError
 
 from app.core.config import settings
 
@@ -51,6 +53,15 @@ class RedisClient:
             raise RuntimeError("Redis client not initialized. Call init() first.")
         return cls._client
 
+    @classmethod
+    async def ping(cls) -> bool:
+        """Check that the Redis server is reachable"""
+        try:
+            return bool(await cls.get_client().ping())
+        except RedisError as e:
+            logger.warning(f"Redis ping failed: {e}")
+            return False
+
     @classmethod
     async def get(cls, key: str) -> Optional[Any]:
         """Get value from Redis"""
@@ -224,6 +235,7 @@ class CacheKeys:
     ORDER = "order:{order_id}"
     POSITION = "position:{position_id}"
     PORTFOLIO = "portfolio:{user_id}"
+    PORTFOLIO_SUMMARY = "portfolio:summary:{user_id}:{watermark}"
 
     # Rate Limiting
     RATE_LIMIT = "rate_limit:{identifier}:{endpoint}"
@@ -16,6 +16,7 @@ from app.core.security import (
     get_password_hash,
     verify_password,
     verify_token,
+    verify_token_claims,
 )
 
 __all__ = [
@@ -37,4 +38,5 @@ __all__ = [
     "get_password_hash",
     "verify_password",
     "verify_token",
+    "verify_token_claims",
 ]
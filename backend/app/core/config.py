@@ -3,6 +3,8 @@ Application Configuration
 Pydantic Settings for environment variables
 """
 
+import copy
+import json
 import os
 from functools import lru_cache
 from pathlib import Path
@@ -16,6 +18,33 @@ from app.core.security import security_audit
 # Get the backend directory path
 BACKEND_DIR = Path(__file__).parent.parent.parent
 
+_DEFAULT_SMC_SYMBOL_CONFIGS = {"default": {"ltf_timeframe": "15m", "htf_timeframe": "1h", "min_quality": 0.6}}
+
+
+@lru_cache(maxsize=8)
+def _parse_smc_symbol_configs(raw: str) -> dict:
+    """
+    Parse the SMC symbol configuration JSON (cached per distinct string)
+
+    The cached dict is shared between callers; copy it before handing it out.
+    """
+    try:
+        return json.loads(raw)
+    except Exception as e:
+        logger.warning(f"Failed to parse SMC symbol configs: {e}")
+        return _DEFAULT_SMC_SYMBOL_CONFIGS
+
+
+@lru_cache(maxsize=1024)
+def _smc_timeframes(raw: str, symbol: str, default_ltf: str, default_htf: str) -> tuple[str, str]:
+    """Resolve a symbol's LTF/HTF timeframes (cached per config and symbol)"""
+    configs = _parse_smc_symbol_configs(raw)
+    config = configs.get(symbol, configs.get("default", {}))
+    return (
+        config.get("ltf_timeframe", default_ltf),
+        config.get("htf_timeframe", default_htf),
+    )
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
@@ -41,11 +70,18 @@ class Settings(BaseSettings):
     # Database - Environment-specific defaults
     database_url: str = ""
     timescale_url: str = ""
+    db_pool_size: int = 0  # 0 = use the environment default
+    db_max_overflow: int = -1  # -1 = use the environment default
+    db_statement_timeout_ms: int = 30000  # 0 = no server-side limit
 
     @property
     def effective_database_url(self) -> str:
         """Get the effective database URL based on environment"""
         if self.database_url:
+            # The engine is async; always drive PostgreSQL through asyncpg
+            for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+                if self.database_url.startswith(prefix):
+                    return "postgresql+asyncpg://" + self.database_url[len(prefix):]
             return self.database_url
 
         # Environment-specific defaults
@@ -206,17 +242,12 @@ class Settings(BaseSettings):
     @property
     def smc_symbol_configs_dict(self) -> dict:
         """Parse SMC symbol configurations from JSON string"""
-        import json
-        try:
-            return json.loads(self.smc_symbol_configs)
-        except Exception as e:
-            logger.warning(f"Failed to parse SMC symbol configs: {e}")
-            return {"default": {"ltf_timeframe": "15m", "htf_timeframe": "1h", "min_quality": 0.6}}
+        return copy.deepcopy(_parse_smc_symbol_configs(self.smc_symbol_configs))
 
     def get_smc_config_for_symbol(self, symbol: str) -> dict:
         """Get SMC configuration for a specific symbol"""
-        configs = self.smc_symbol_configs_dict
-        return configs.get(symbol, configs.get("default", {}))
+        configs = _parse_smc_symbol_configs(self.smc_symbol_configs)
+        return copy.deepcopy(configs.get(symbol, configs.get("default", {})))
 
     def is_smc_enabled_for_symbol(self, symbol: str) -> bool:
         """Check if SMC is enabled for a symbol"""
@@ -225,10 +256,11 @@ class Settings(BaseSettings):
 
     def get_smc_timeframes_for_symbol(self, symbol: str) -> tuple[str, str]:
         """Get LTF and HTF timeframes for a symbol"""
-        config = self.get_smc_config_for_symbol(symbol)
-        ltf = config.get("ltf_timeframe", self.smc_ltf_timeframe)
-        htf = config.get("htf_timeframe", self.smc_htf_timeframe)
-        return ltf, htf
+        # Keyed on the raw settings values, so changed settings miss the cache
+        return _smc_timeframes(
+            self.smc_symbol_configs, symbol,
+            self.smc_ltf_timeframe, self.smc_htf_timeframe,
+        )
 
     def audit_configuration_change(
         self,
@@ -15,10 +15,14 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import text
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from loguru import logger
 
 from app.core.config import settings
 
+# Compiled-statement cache entries per engine (SQLAlchemy default is 500)
+QUERY_CACHE_SIZE = 2000
+
 # Production-grade database connection pooling validation
 def get_pool_config() -> Dict[str, Any]:
     """Get optimized connection pool configuration based on database type and environment"""
@@ -28,7 +32,7 @@ def get_pool_config() -> Dict[str, Any]:
     if is_postgres:
         if is_production:
             # Production PostgreSQL settings - optimized for high load
-            return {
+            config = {
                 "pool_size": 20,  # Core connection pool size
                 "max_overflow": 30,  # Additional connections allowed
                 "pool_timeout": 30,  # Connection acquisition timeout
@@ -39,7 +43,7 @@ def get_pool_config() -> Dict[str, Any]:
             }
         else:
             # Development PostgreSQL settings
-            return {
+            config = {
                 "pool_size": 10,
                 "max_overflow": 20,
                 "pool_timeout": 30,
@@ -48,6 +52,26 @@ def get_pool_config() -> Dict[str, Any]:
                 "pool_reset_on_return": "rollback",
                 "echo": settings.debug,
             }
+
+        # Explicit async-safe pool, sized from DB_POOL_SIZE / DB_MAX_OVERFLOW when set
+        config["poolclass"] = AsyncAdaptedQueuePool
+        config["query_cache_size"] = QUERY_CACHE_SIZE
+        # Keep more parsed statements per connection: SQLAlchemy's asyncpg
+        # prepared-statement cache and asyncpg's own statement cache
+        config["connect_args"] = {
+            "prepared_statement_cache_size": 500,
+            "statement_cache_size": 1024,
+        }
+        # Cancel runaway queries server-side so they cannot hold pool connections
+        if settings.db_statement_timeout_ms > 0:
+            config["connect_args"]["server_settings"] = {
+                "statement_timeout": str(settings.db_statement_timeout_ms),
+            }
+        if settings.db_pool_size > 0:
+            config["pool_size"] = settings.db_pool_size
+        if settings.db_max_overflow >= 0:
+            config["max_overflow"] = settings.db_max_overflow
+        return config
     else:
         # SQLite settings (development only)
         return {
@@ -55,6 +79,7 @@ def get_pool_config() -> Dict[str, Any]:
             "max_overflow": 10,
             "connect_args": {"check_same_thread": False},
             "pool_pre_ping": True,
+            "query_cache_size": QUERY_CACHE_SIZE,
             "echo": settings.debug,
         }
 
@@ -220,6 +245,27 @@ async def _test_connection_acquisition_under_load(validation_results: Dict[str,
         if checked_out > 0:
             validation_results["warnings"].append(f"{checked_out} connections still checked out after load test")
 
+
+async def warm_connection_pool() -> int:
+    """
+    Open `pool_size` connections up front so the first requests
+    after startup don't pay the connect cost.
+    Returns the number of connections opened.
+    """
+    import asyncio
+
+    if not isinstance(engine.pool, AsyncAdaptedQueuePool):
+        return 0
+    size = engine.pool.size()
+
+    # Hold them all at once so the pool really grows to `size`
+    results = await asyncio.gather(*(engine.connect() for _ in range(size)), return_exceptions=True)
+    connections = [conn for conn in results if not isinstance(conn, BaseException)]
+    for conn in connections:
+        await conn.close()
+    return len(connections)
+
+
 # Session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -236,7 +282,13 @@ class Base(DeclarativeBase):
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting database session"""
+    """
+    Dependency for getting database session
+
+    Sessions do not expire objects on commit, so handlers can return rows they
+    just committed without db.refresh(); server defaults come back through
+    RETURNING on mappers with eager_defaults.
+    """
     async with async_session_maker() as session:
         try:
             yield session
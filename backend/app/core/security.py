@@ -1208,7 +1208,9 @@ class IPWhitelistMiddleware:
 
 # ===== JWT TOKEN MANAGEMENT =====
 
-from jose import JWTError, jwt
+from functools import lru_cache
+
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 
 
@@ -1226,6 +1228,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+@lru_cache(maxsize=4)
+def _jwt_key(secret_key: str, algorithm: str):
+    """Build the JWT key object once instead of on every encode/decode"""
+    return jwk.construct(secret_key, algorithm)
+
+
 def create_access_token(subject: str | int, expires_delta: Optional[timedelta] = None) -> str:
     """Create access token"""
     if expires_delta:
@@ -1240,7 +1248,7 @@ def create_access_token(subject: str | int, expires_delta: Optional[timedelta] =
         "type": "access"
     }
 
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    encoded_jwt = jwt.encode(to_encode, _jwt_key(settings.secret_key, settings.algorithm), algorithm=settings.algorithm)
     return encoded_jwt
 
 
@@ -1255,7 +1263,7 @@ def create_refresh_token(subject: str | int) -> str:
         "type": "refresh"
     }
 
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    encoded_jwt = jwt.encode(to_encode, _jwt_key(settings.secret_key, settings.algorithm), algorithm=settings.algorithm)
     return encoded_jwt
 
 
@@ -1268,10 +1276,14 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def verify_token(token: str, token_type: str = "access") -> Optional[str]:
-    """Verify token and return subject (user ID)"""
+def verify_token_claims(token: str, token_type: str = "access") -> Optional[Dict[str, Any]]:
+    """Verify token and return its claims"""
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt.decode(
+            token,
+            _jwt_key(settings.secret_key, settings.algorithm),
+            algorithms=[settings.algorithm],
+        )
 
         # Check token type
         if payload.get("type") != token_type:
@@ -1282,16 +1294,21 @@ def verify_token(token: str, token_type: str = "access") -> Optional[str]:
         if exp and datetime.utcfromtimestamp(exp) < datetime.utcnow():
             return None
 
-        subject = payload.get("sub")
-        if subject is None:
+        if payload.get("sub") is None:
             return None
 
-        return subject
+        return payload
 
     except JWTError:
         return None
 
 
+def verify_token(token: str, token_type: str = "access") -> Optional[str]:
+    """Verify token and return subject (user ID)"""
+    payload = verify_token_claims(token, token_type)
+    return payload["sub"] if payload else None
+
+
 # Export security utilities
 __all__ = [
     "APIKeyManager",
@@ -1309,5 +1326,6 @@ __all__ = [
     "create_access_token",
     "create_refresh_token",
     "decode_token",
-    "verify_token"
+    "verify_token",
+    "verify_token_claims",
 ]
@@ -11,7 +11,7 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from loguru import logger
 
 # Add project root to path
@@ -23,6 +23,7 @@ setup_logging()
 from app.core import settings, init_db, close_db
 from app.core.logging import setup_logging
 from app.core.metrics import MetricsMiddleware, get_metrics_response, MetricsCollector
+from app.cache import RedisClient, init_redis, close_redis
 from app.api.v1.endpoints import auth, signals, signals_smc, orders, portfolio, market, health
 from app.websocket import router as ws_router
 from app.middleware import RateLimitMiddleware, RequestLoggingMiddleware, CORSSecurityMiddleware, APIVersionMiddleware
@@ -41,6 +42,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     await init_db()
     logger.info("✅ Database initialized")
     
+    # Initialize Redis once; handlers reuse the client from app.state. The pool
+    # connects lazily, so ping first: an unreachable server leaves caching off
+    # instead of failing a connection attempt on every request
+    app.state.redis = None
+    if settings.redis_host:
+        await init_redis()
+        if await RedisClient.ping():
+            app.state.redis = RedisClient.get_client()
+            logger.info("✅ Redis client initialized")
+        else:
+            logger.warning("⚠️ Redis unreachable; caching disabled")
+    
     # Start task scheduler
     await task_scheduler.start()
     logger.info("✅ Task scheduler started")
@@ -65,6 +78,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
     logger.info("✅ Database health checks passed")
 
+    # Pre-open pooled connections so early requests don't pay connect cost
+    from app.core.database import warm_connection_pool
+    warmed = await warm_connection_pool()
+    logger.info(f"✅ Database pool warmed ({warmed} connections)")
+
     # Analyze database indexing strategy
     from app.services.database_indexing_service import get_index_maintenance_report
     logger.info("🔍 Analyzing database indexing strategy...")
@@ -200,6 +218,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     await task_scheduler.stop()
     logger.info("✅ Task scheduler stopped")
     
+    # Close Redis
+    if settings.redis_host:
+        await close_redis()
+        logger.info("✅ Redis connections closed")
+    
     # Close database
     await close_db()
     logger.info("✅ Database connections closed")
@@ -238,6 +261,7 @@ app = FastAPI(
     openapi_url="/api/v1/openapi.json",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
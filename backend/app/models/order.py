@@ -12,11 +12,13 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     JSON,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -137,6 +139,21 @@ class Order(Base):
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="orders")
 
+    # Indexes for a user's orders, newest first (keyset pagination, status
+    # filters, and the small partial index of still-open orders)
+    __table_args__ = (
+        Index('ix_orders_user_created', 'user_id', 'created_at', 'id'),
+        Index('ix_orders_user_status_created', 'user_id', 'status', 'created_at', 'id'),
+        Index(
+            'ix_orders_user_open',
+            'user_id',
+            'created_at',
+            postgresql_where=text("status IN ('PENDING', 'SUBMITTED')"),
+        ),
+        # Day-range lookups on order_time (today's orders)
+        Index('ix_orders_user_order_time', 'user_id', 'order_time'),
+    )
+
     def __repr__(self) -> str:
         return f"<Order(id={self.id}, symbol='{self.symbol}', side={self.side}, status={self.status})>"
 
@@ -13,6 +13,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -113,6 +114,13 @@ class Position(Base):
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="positions")
 
+    # Indexes for a user's positions by status, newest first (open positions
+    # by created_at, trade history by exit_time)
+    __table_args__ = (
+        Index('ix_positions_user_status_created', 'user_id', 'status', 'created_at'),
+        Index('ix_positions_user_status_exit', 'user_id', 'status', 'exit_time'),
+    )
+
     def __repr__(self) -> str:
         return f"<Position(id={self.id}, symbol='{self.symbol}', side={self.side}, pnl={self.unrealized_pnl})>"
 
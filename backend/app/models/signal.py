@@ -13,6 +13,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -179,6 +180,19 @@ class Signal(Base):
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="signals")
 
+    # Indexes for per-user history and symbol timelines
+    __table_args__ = (
+        Index('ix_signals_user_time', 'user_id', 'signal_time'),
+        Index('ix_signals_symbol_time', 'symbol', 'signal_time'),
+        # Newest-first listings: a user's signals, and their active signals
+        Index('ix_signals_user_created', 'user_id', 'created_at', 'id'),
+        Index('ix_signals_user_status_created', 'user_id', 'status', 'created_at'),
+    )
+
+    # Fetch server defaults (id, timestamps) with INSERT/UPDATE ... RETURNING
+    # instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<Signal(id={self.id}, symbol='{self.symbol}', action={self.action}, prob={self.probability})>"
 
@@ -100,9 +100,11 @@ class User(Base):
     )
 
     # Relationships
-    signals: Mapped[List["Signal"]] = relationship("Signal", back_populates="user", lazy="selectin")
-    orders: Mapped[List["Order"]] = relationship("Order", back_populates="user", lazy="selectin")
-    positions: Mapped[List["Position"]] = relationship("Position", back_populates="user", lazy="selectin")
+    # Collections grow with trading history, so they are never loaded implicitly;
+    # callers that need them must ask for them with selectinload()
+    signals: Mapped[List["Signal"]] = relationship("Signal", back_populates="user", lazy="raise")
+    orders: Mapped[List["Order"]] = relationship("Order", back_populates="user", lazy="raise")
+    positions: Mapped[List["Position"]] = relationship("Position", back_populates="user", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email='{self.email}', role={self.role})>"
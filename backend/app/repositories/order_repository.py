@@ -4,7 +4,8 @@ Order-specific database operations
 """
 
 from typing import List, Optional
-from datetime import datetime, date
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 from sqlalchemy import select, and_, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +13,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.base import BaseRepository
 from app.models.order import Order, OrderType, OrderStatus, ProductType, OrderSide
 
+# Trading days follow the exchange calendar (IST), as in the market endpoints
+IST = ZoneInfo("Asia/Kolkata")
+
 
 class OrderRepository(BaseRepository[Order]):
     """Repository for Order model operations"""
@@ -130,10 +134,17 @@ class OrderRepository(BaseRepository[Order]):
         limit: int = 100
     ) -> List[Order]:
         """Get today's orders"""
-        today = date.today()
-        query = select(Order).where(
-            func.date(Order.order_time) == today
+        # Half-open range on the bare column so an order_time index applies;
+        # bounds are naive UTC like the stored order times
+        start_of_day = (
+            datetime.combine(datetime.now(IST).date(), time.min, tzinfo=IST)
+            .astimezone(timezone.utc)
+            .replace(tzinfo=None)
         )
+        query = select(Order).where(and_(
+            Order.order_time >= start_of_day,
+            Order.order_time < start_of_day + timedelta(days=1)
+        ))
 
         if user_id:
             query = query.where(Order.user_id == user_id)
@@ -242,10 +253,15 @@ class OrderRepository(BaseRepository[Order]):
 
     async def get_order_stats(self, user_id: int) -> dict:
         """Get order statistics for a user"""
-        total = await self.count({"user_id": user_id})
-        filled = await self.count({"user_id": user_id, "status": OrderStatus.FILLED})
-        cancelled = await self.count({"user_id": user_id, "status": OrderStatus.CANCELLED})
-        rejected = await self.count({"user_id": user_id, "status": OrderStatus.REJECTED})
+        # One scan and one round trip: per-status counts via COUNT(*) FILTER
+        query = select(
+            func.count().label("total"),
+            func.count().filter(Order.status == OrderStatus.FILLED).label("filled"),
+            func.count().filter(Order.status == OrderStatus.CANCELLED).label("cancelled"),
+            func.count().filter(Order.status == OrderStatus.REJECTED).label("rejected"),
+        ).where(Order.user_id == user_id)
+        stats = (await self.session.execute(query)).one()
+        total, filled, cancelled, rejected = stats
 
         fill_rate = (filled / total * 100) if total > 0 else 0.0
 
@@ -27,6 +27,7 @@ from app.schemas.signal import (
     SignalUpdate,
     SignalResponse,
     SignalListResponse,
+    SignalBatchResponse,
     SignalStatsResponse,
     SignalFilter,
     OrderSide,
@@ -70,6 +71,7 @@ __all__ = [
     "SignalUpdate",
     "SignalResponse",
     "SignalListResponse",
+    "SignalBatchResponse",
     "SignalStatsResponse",
     "SignalFilter",
     # Order
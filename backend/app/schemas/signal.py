@@ -156,10 +156,18 @@ class SignalResponse(SignalBase):
 class SignalListResponse(BaseModel):
     """Schema for signal list response"""
     signals: List[SignalResponse]
-    total: int
-    page: int
+    total: Optional[int] = None  # Not computed on cursor pages
+    page: Optional[int] = None
     page_size: int
     has_next: bool
+    next_cursor: Optional[str] = None
+
+
+class SignalBatchResponse(BaseModel):
+    """Schema for batch signal generation response"""
+    signals: List[SignalResponse]
+    skipped: List[str] = []  # No setup (HOLD) or beyond the batch limit
+    failed: List[str] = []  # Analysis raised an error
 
 
 class SignalStatsResponse(BaseModel):
@@ -231,6 +239,7 @@ class OrderCreate(BaseModel):
     price: float = Field(default=0, ge=0)
     trigger_price: Optional[float] = None
     stop_loss: Optional[float] = None
+    target: Optional[float] = None  # Used by the risk audit, not stored
     square_off: Optional[float] = None
     trailing_sl: Optional[float] = None
     signal_id: Optional[int] = None
@@ -275,10 +284,11 @@ class OrderResponse(BaseModel):
 class OrderListResponse(BaseModel):
     """Schema for order list response"""
     orders: List[OrderResponse]
-    total: int
-    page: int
+    total: Optional[int] = None  # Not computed on cursor pages
+    page: Optional[int] = None
     page_size: int
     has_next: bool
+    next_cursor: Optional[str] = None
 
 
 # Position Schemas
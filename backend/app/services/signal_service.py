@@ -5,7 +5,6 @@ Business logic for signal generation using real market data
 
 from datetime import datetime
 from typing import Dict, List, Optional
-import uuid
 
 from loguru import logger
 
@@ -13,6 +12,7 @@ from app.engines.smc_engine import smc_engine
 from app.engines.risk_engine import risk_engine
 from app.brokers.angel_one import AngelOneAPI
 from app.cache.market_cache import MarketDataCache
+from app.utils.ids import uuid7
 
 
 class SignalService:
@@ -48,7 +48,7 @@ class SignalService:
         Returns:
             Signal dictionary with real market data
         """
-        trace_id = str(uuid.uuid4())[:12]
+        trace_id = str(uuid7())
         logger.info(f"[{trace_id}] Generating signal for {symbol} on {exchange}")
 
         try:
@@ -5,13 +5,13 @@ Pure Smart Money Concept trading signals
 
 from datetime import datetime
 from typing import Dict, List, Optional
-import uuid
 
 from loguru import logger
 
 from app.engines.smc_engine import smc_engine, SMCSetup
 from app.engines.risk_engine import risk_engine
 from app.services.market_data_service import market_data_service
+from app.utils.ids import uuid7
 
 
 class SignalServiceSMC:
@@ -50,7 +50,7 @@ class SignalServiceSMC:
         Returns:
             SMC signal dictionary
         """
-        trace_id = str(uuid.uuid4())[:12]
+        trace_id = str(uuid7())
         logger.info(f"🎯 [{trace_id}] Generating SMC signal for {symbol}")
 
         try:
@@ -10,6 +10,7 @@ from typing import Callable, Dict, List, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
 
+import orjson
 from loguru import logger
 from fastapi import WebSocket, WebSocketDisconnect
 
@@ -289,6 +290,11 @@ class MarketDataStreamer:
                 await asyncio.sleep(5)
 
 
+# Signal messages buffered per client; further signals are dropped for that
+# client until its sender catches up
+SIGNAL_QUEUE_SIZE = 100
+
+
 @dataclass
 class SignalSubscription:
     """Signal subscription details"""
@@ -312,6 +318,8 @@ class SignalManager:
         self.signal_connections: Dict[str, WebSocket] = {}
         self.signal_subscriptions: Dict[str, SignalSubscription] = {}
         self.symbol_signal_subscribers: Dict[str, Set[str]] = {}  # symbol -> client_ids
+        self.signal_queues: Dict[str, asyncio.Queue] = {}  # client_id -> encoded messages
+        self.signal_senders: Dict[str, asyncio.Task] = {}  # client_id -> sender task
 
         logger.info("📡 Signal Manager initialized")
 
@@ -324,13 +332,34 @@ class SignalManager:
             symbols=set(),
             strategies={"SMC"}  # Default to SMC
         )
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SIGNAL_QUEUE_SIZE)
+        self.signal_queues[client_id] = queue
+        self.signal_senders[client_id] = asyncio.create_task(
+            self._signal_sender(client_id, websocket, queue)
+        )
         logger.info(f"📡 Signal client connected: {client_id}")
 
+    async def _signal_sender(self, client_id: str, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """Drain a client's signal queue onto its socket"""
+        while True:
+            text = await queue.get()
+            try:
+                await websocket.send_text(text)
+            except Exception as e:
+                logger.warning(f"Failed to send signal to {client_id}: {e}")
+                self.disconnect_signals(client_id)
+                return
+
     def disconnect_signals(self, client_id: str) -> None:
         """Handle signal client disconnection"""
         if client_id in self.signal_connections:
             del self.signal_connections[client_id]
 
+        self.signal_queues.pop(client_id, None)
+        sender = self.signal_senders.pop(client_id, None)
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
+
         if client_id in self.signal_subscriptions:
             # Remove from symbol subscribers
             for symbol in self.signal_subscriptions[client_id].symbols:
@@ -382,7 +411,12 @@ class SignalManager:
         logger.info(f"📡 Client {client_id} unsubscribed from signals: {symbols}")
 
     async def broadcast_signal(self, signal_data: Dict) -> None:
-        """Broadcast signal to subscribed clients"""
+        """
+        Broadcast signal to subscribed clients
+
+        The message is encoded once and queued for each client's sender task,
+        so a slow socket never holds up the broadcast or other clients.
+        """
         symbol = signal_data.get("symbol", "")
         strategy = signal_data.get("strategy", "SMC")
         quality_score = signal_data.get("quality_score", 0.0)
@@ -390,13 +424,15 @@ class SignalManager:
         if symbol not in self.symbol_signal_subscribers:
             return
 
-        message = {
-            "type": "signal",
-            "data": signal_data,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-
-        disconnected: List[str] = []
+        # Encoded once for every recipient; sent as a text frame like other messages
+        text = orjson.dumps(
+            {
+                "type": "signal",
+                "data": signal_data,
+                "timestamp": datetime.utcnow().isoformat()
+            },
+            option=orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
 
         for client_id in self.symbol_signal_subscribers[symbol]:
             if client_id in self.signal_subscriptions:
@@ -408,17 +444,14 @@ class SignalManager:
                 if quality_score < subscription.min_quality:
                     continue
 
-                # Send to client
-                if client_id in self.signal_connections:
-                    try:
-                        await self.signal_connections[client_id].send_json(message)
-                    except Exception as e:
-                        logger.warning(f"Failed to send signal to {client_id}: {e}")
-                        disconnected.append(client_id)
-
-        # Clean up disconnected clients
-        for client_id in disconnected:
-            self.disconnect_signals(client_id)
+                # Queue for the client's sender
+                queue = self.signal_queues.get(client_id)
+                if queue is None:
+                    continue
+                try:
+                    queue.put_nowait(text)
+                except asyncio.QueueFull:
+                    logger.warning(f"Signal queue full for {client_id}; dropping signal for {symbol}")
 
     async def send_to_signal_client(self, client_id: str, message: Dict) -> bool:
         """Send message to specific signal client"""
@@ -53,3 +53,25 @@ async def client(db_session):
         yield ac
     
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def auth_headers(client):
+    """Register and log in a user, returning bearer auth headers"""
+    async def _auth_headers(email: str, mobile: str) -> dict:
+        await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": email,
+                "mobile": mobile,
+                "password": "password123",
+                "confirm_password": "password123"
+            }
+        )
+        login_response = await client.post(
+            "/api/v1/auth/login",
+            json={"email": email, "password": "password123"}
+        )
+        return {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    
+    return _auth_headers
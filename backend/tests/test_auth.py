@@ -2,9 +2,14 @@
 Authentication Tests
 """
 
+from typing import Optional
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.exc import IntegrityError
 
+from app.api.v1.endpoints import auth as auth_endpoints
 from app.core import get_password_hash
 from app.models import User, UserRole, Plan
 
@@ -56,6 +61,123 @@ async def test_register_duplicate_email(client: AsyncClient):
     )
     
     assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
+
+@pytest.mark.asyncio
+async def test_register_duplicate_mobile(client: AsyncClient):
+    """Test registration with duplicate mobile"""
+    # First registration
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test3@example.com",
+            "mobile": "9876543213",
+            "password": "testpassword123",
+            "confirm_password": "testpassword123"
+        }
+    )
+    
+    # Second registration with same mobile
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test4@example.com",
+            "mobile": "9876543213",
+            "password": "testpassword123",
+            "confirm_password": "testpassword123"
+        }
+    )
+    
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Mobile number already registered"
+
+
+@pytest.mark.asyncio
+async def test_register_duplicate_skips_password_hash(client: AsyncClient):
+    """A duplicate is rejected before the password is hashed"""
+    payload = {
+        "email": "test5@example.com",
+        "mobile": "9876543214",
+        "password": "testpassword123",
+        "confirm_password": "testpassword123"
+    }
+    await client.post("/api/v1/auth/register", json=payload)
+    
+    with patch.object(auth_endpoints, "get_password_hash") as mock_hash:
+        response = await client.post("/api/v1/auth/register", json=payload)
+    
+    assert response.status_code == 400
+    mock_hash.assert_not_called()
+
+
+def _integrity_error(message: str, constraint_name: Optional[str] = None) -> IntegrityError:
+    """IntegrityError as raised by SQLite, or by asyncpg when constraint_name is set"""
+    orig = Exception(message)
+    if constraint_name is not None:
+        cause = Exception(message)
+        cause.constraint_name = constraint_name
+        orig.__cause__ = cause
+    return IntegrityError("INSERT INTO users", {}, orig)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error, detail", [
+    (_integrity_error("UNIQUE constraint failed: users.email"), "Email already registered"),
+    (_integrity_error("UNIQUE constraint failed: users.mobile"), "Mobile number already registered"),
+    (
+        _integrity_error(
+            'duplicate key value violates unique constraint "ix_users_email"\n'
+            "DETAIL:  Key (email)=(test6@example.com) already exists.",
+            "ix_users_email",
+        ),
+        "Email already registered",
+    ),
+    (
+        # The duplicate value appears in the message; only the constraint name counts
+        _integrity_error(
+            'duplicate key value violates unique constraint "ix_users_mobile"\n'
+            "DETAIL:  Key (mobile)=(email-9876543215) already exists.",
+            "ix_users_mobile",
+        ),
+        "Mobile number already registered",
+    ),
+])
+async def test_register_concurrent_duplicate(
+    client: AsyncClient, db_session, error: IntegrityError, detail: str
+):
+    """A duplicate inserted between the check and the commit maps to a 400"""
+    with patch.object(db_session, "commit", AsyncMock(side_effect=error)):
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "test6@example.com",
+                "mobile": "9876543215",
+                "password": "testpassword123",
+                "confirm_password": "testpassword123"
+            }
+        )
+    
+    assert response.status_code == 400
+    assert response.json()["detail"] == detail
+
+
+@pytest.mark.asyncio
+async def test_register_other_integrity_error(client: AsyncClient, db_session):
+    """Integrity errors on other constraints are not reported as duplicates"""
+    with patch.object(
+        db_session, "commit",
+        AsyncMock(side_effect=_integrity_error("NOT NULL constraint failed: users.role"))
+    ), pytest.raises(IntegrityError):
+        await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "test7@example.com",
+                "mobile": "9876543216",
+                "password": "testpassword123",
+                "confirm_password": "testpassword123"
+            }
+        )
 
 
 @pytest.mark.asyncio
@@ -141,6 +263,35 @@ async def test_get_current_user(client: AsyncClient, db_session):
     assert data["email"] == "profile@example.com"
 
 
+@pytest.mark.asyncio
+async def test_access_token_verified_once(client: AsyncClient):
+    """A token is decoded once on a cache miss and not again while cached"""
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "tokencache@example.com",
+            "mobile": "9876543231",
+            "password": "password123",
+            "confirm_password": "password123"
+        }
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "tokencache@example.com", "password": "password123"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    
+    auth_endpoints._token_cache.clear()
+    with patch.object(
+        auth_endpoints, "verify_token_claims", wraps=auth_endpoints.verify_token_claims
+    ) as mock_verify:
+        for _ in range(2):
+            response = await client.get("/api/v1/auth/me", headers=headers)
+            assert response.status_code == 200
+    
+    mock_verify.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_unauthorized_access(client: AsyncClient):
     """Test accessing protected route without token"""
@@ -60,6 +60,42 @@ class TestSettings:
             assert isinstance(configs, dict)
             assert 'default' in configs
 
+    def test_smc_config_copies_are_independent(self):
+        """Mutating a returned SMC config does not leak into the parse cache"""
+        with patch.dict('os.environ', {
+            'SECRET_KEY': 'test_secret_key_32_chars_long_enough',
+        }):
+            settings = Settings()
+
+            configs = settings.smc_symbol_configs_dict
+            configs['default']['ltf_timeframe'] = '1m'
+            configs['TCS'] = {'enabled': False}
+            settings.get_smc_config_for_symbol('RELIANCE')['htf_timeframe'] = '1d'
+
+            assert 'TCS' not in settings.smc_symbol_configs_dict
+            assert settings.is_smc_enabled_for_symbol('TCS')
+            default = settings.get_smc_config_for_symbol('RELIANCE')
+            assert default['ltf_timeframe'] != '1m'
+            assert default['htf_timeframe'] != '1d'
+
+    def test_smc_timeframes_for_symbol(self):
+        """Test per-symbol SMC timeframes, including the cached lookup"""
+        with patch.dict('os.environ', {
+            'SECRET_KEY': 'test_secret_key_32_chars_long_enough',
+            'SMC_SYMBOL_CONFIGS': '{"default": {"ltf_timeframe": "15m", "htf_timeframe": "1h"}, '
+                                  '"TCS": {"ltf_timeframe": "5m", "htf_timeframe": "4h"}}',
+        }):
+            settings = Settings()
+
+            assert settings.get_smc_timeframes_for_symbol("TCS") == ("5m", "4h")
+            assert settings.get_smc_timeframes_for_symbol("RELIANCE") == ("15m", "1h")
+            # Repeated lookups hit the cache and return the same answer
+            assert settings.get_smc_timeframes_for_symbol("TCS") == ("5m", "4h")
+
+            # A different configuration string is a different cache key
+            settings.smc_symbol_configs = '{"default": {"ltf_timeframe": "5m", "htf_timeframe": "1h"}}'
+            assert settings.get_smc_timeframes_for_symbol("TCS") == ("5m", "1h")
+
     @pytest.mark.asyncio
     async def test_configuration_audit(self):
         """Test configuration change auditing"""
@@ -397,6 +397,17 @@ class TestSMCIntegration:
         for signal in data["signals"]:
             assert signal["status"] == "ACTIVE"
 
+        # SMC list: the total must honour the same filters as the page
+        response = await client.get(
+            "/api/v1/signals/smc/?symbol=RELIANCE",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert len(data["signals"]) == 2
+
     @pytest.mark.asyncio
     async def test_smc_signal_pagination(self, client: AsyncClient, db_session: AsyncSession):
         """Test SMC signal pagination"""
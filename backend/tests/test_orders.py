@@ -0,0 +1,167 @@
+"""
+Order Tests
+"""
+
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.models import Order, OrderSide, OrderStatus, Position, PositionSide, PositionStatus
+
+
+async def _user_id(db_session, email: str) -> int:
+    result = await db_session.execute(
+        text("SELECT id FROM users WHERE email = :email"), {"email": email}
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_get_orders_cursor_pages(client: AsyncClient, auth_headers, db_session):
+    """Cursor pages walk every order once, breaking created_at ties by id"""
+    headers = await auth_headers("orders_cursor@example.com", "9876543260")
+    user_id = await _user_id(db_session, "orders_cursor@example.com")
+
+    base = datetime(2025, 1, 1, 10, 0)
+    # Three orders share a created_at, so page boundaries fall inside the tie
+    created = [base, base + timedelta(minutes=1), base + timedelta(minutes=1),
+               base + timedelta(minutes=1), base + timedelta(minutes=2)]
+    orders = [
+        Order(user_id=user_id, symbol=f"SYM{i}", side=OrderSide.BUY, quantity=1, created_at=at)
+        for i, at in enumerate(created)
+    ]
+    db_session.add_all(orders)
+    await db_session.commit()
+    expected = [
+        order.id for order in sorted(orders, key=lambda o: (o.created_at, o.id), reverse=True)
+    ]
+
+    response = await client.get("/api/v1/orders/?page_size=2", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 5
+    seen = [order["id"] for order in data["orders"]]
+
+    while data["next_cursor"]:
+        response = await client.get(
+            "/api/v1/orders/",
+            params={"page_size": 2, "cursor": data["next_cursor"]},
+            headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        assert data["page"] is None
+        seen.extend(order["id"] for order in data["orders"])
+
+    assert seen == expected
+    # The last page has one order and nothing after it
+    assert len(data["orders"]) == 1
+    assert data["has_next"] is False
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    base64.urlsafe_b64encode(b"5").decode(),
+    base64.urlsafe_b64encode(b'["yesterday", 1]').decode(),
+])
+async def test_get_orders_invalid_cursor(client: AsyncClient, auth_headers, cursor: str):
+    """Malformed cursors are rejected with 400"""
+    headers = await auth_headers("orders_bad_cursor@example.com", "9876543261")
+
+    response = await client.get("/api/v1/orders/", params={"cursor": cursor}, headers=headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+async def _order_status(db_session, order_id: int) -> str:
+    result = await db_session.execute(
+        text("SELECT status FROM orders WHERE id = :id"), {"id": order_id}
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_cancel_order(client: AsyncClient, auth_headers, db_session):
+    """Pending orders cancel; filled orders and other users' orders do not"""
+    headers = await auth_headers("cancel@example.com", "9876543262")
+    user_id = await _user_id(db_session, "cancel@example.com")
+    await auth_headers("cancel_other@example.com", "9876543263")
+    other_id = await _user_id(db_session, "cancel_other@example.com")
+
+    pending = Order(user_id=user_id, symbol="TCS", side=OrderSide.BUY, quantity=1)
+    filled = Order(user_id=user_id, symbol="TCS", side=OrderSide.BUY, quantity=1,
+                   status=OrderStatus.FILLED)
+    others = Order(user_id=other_id, symbol="TCS", side=OrderSide.BUY, quantity=1)
+    db_session.add_all([pending, filled, others])
+    await db_session.commit()
+
+    response = await client.post(f"/api/v1/orders/{pending.id}/cancel", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["order_id"] == pending.id
+    assert await _order_status(db_session, pending.id) == "CANCELLED"
+
+    response = await client.post(f"/api/v1/orders/{filled.id}/cancel", headers=headers)
+    assert response.status_code == 400
+    assert await _order_status(db_session, filled.id) == "FILLED"
+
+    response = await client.post(f"/api/v1/orders/{others.id}/cancel", headers=headers)
+    assert response.status_code == 404
+    assert await _order_status(db_session, others.id) == "PENDING"
+
+
+@pytest.mark.asyncio
+async def test_square_off_position(client: AsyncClient, auth_headers, db_session):
+    """Square-off closes the user's open position and places the exit order"""
+    headers = await auth_headers("squareoff@example.com", "9876543264")
+    user_id = await _user_id(db_session, "squareoff@example.com")
+    await auth_headers("squareoff_other@example.com", "9876543265")
+    other_id = await _user_id(db_session, "squareoff_other@example.com")
+
+    def position(owner: int, symbol: str, status: PositionStatus) -> Position:
+        return Position(
+            user_id=owner, symbol=symbol, side=PositionSide.LONG, status=status,
+            quantity=10, open_quantity=10, entry_price=100.0
+        )
+
+    open_position = position(user_id, "TCS", PositionStatus.OPEN)
+    db_session.add_all([
+        open_position,
+        position(user_id, "INFY", PositionStatus.CLOSED),
+        position(other_id, "WIPRO", PositionStatus.OPEN),
+    ])
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/orders/square-off", params={"symbol": "TCS"}, headers=headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["position_id"] == open_position.id
+    row = (await db_session.execute(
+        text("SELECT status, exit_time FROM positions WHERE id = :id"), {"id": open_position.id}
+    )).one()
+    assert row.status == "CLOSED"
+    assert row.exit_time is not None
+    order = (await db_session.execute(
+        text("SELECT side, quantity, status FROM orders WHERE id = :id"), {"id": data["order_id"]}
+    )).one()
+    assert tuple(order) == ("SELL", 10, "PENDING")
+
+    # Already closed, never open, and another user's position
+    for symbol in ("TCS", "INFY", "WIPRO"):
+        response = await client.post(
+            "/api/v1/orders/square-off", params={"symbol": symbol}, headers=headers
+        )
+        assert response.status_code == 404
+
+    status = (await db_session.execute(
+        text("SELECT status FROM positions WHERE symbol = 'WIPRO'")
+    )).scalar_one()
+    assert status == "OPEN"
@@ -0,0 +1,171 @@
+"""
+Portfolio Tests
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from httpx import AsyncClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import text
+
+from app.cache import RedisClient
+from app.main import app
+from app.models import Position, PositionSide, PositionStatus
+
+POSITION_KEYS = {attr.key for attr in Position.__mapper__.column_attrs}
+
+
+@pytest.mark.asyncio
+async def test_redis_ping_when_unreachable():
+    """An unreachable Redis fails the startup ping instead of raising"""
+    client = MagicMock()
+    client.ping = AsyncMock(side_effect=RedisConnectionError("Connection refused"))
+    with patch.object(RedisClient, "get_client", return_value=client):
+        assert await RedisClient.ping() is False
+
+
+@pytest.mark.asyncio
+async def test_portfolio_summary_without_redis(client: AsyncClient, auth_headers):
+    """With caching off after a failed ping, summaries never touch Redis"""
+    headers = await auth_headers("summary_nocache@example.com", "9876543255")
+
+    previous_redis = getattr(app.state, "redis", None)
+    app.state.redis = None  # What startup leaves when the ping fails
+    try:
+        with patch.object(RedisClient, "get", AsyncMock()) as mock_get, \
+                patch.object(RedisClient, "set", AsyncMock()) as mock_set:
+            for _ in range(2):
+                response = await client.get("/api/v1/portfolio/summary", headers=headers)
+                assert response.status_code == 200
+                assert response.json()["total_positions"] == 0
+    finally:
+        app.state.redis = previous_redis
+
+    mock_get.assert_not_called()
+    mock_set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_portfolio_summary_when_redis_read_fails(client: AsyncClient, auth_headers):
+    """Summary is computed from the database when the cache cannot be read"""
+    headers = await auth_headers("summary_read@example.com", "9876543250")
+
+    previous_redis = getattr(app.state, "redis", None)
+    app.state.redis = object()  # Redis configured, but unreachable
+    try:
+        with patch.object(RedisClient, "get", AsyncMock(side_effect=RedisConnectionError("down"))), \
+                patch.object(RedisClient, "set", AsyncMock()) as mock_set:
+            response = await client.get("/api/v1/portfolio/summary", headers=headers)
+    finally:
+        app.state.redis = previous_redis
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_positions"] == 0
+    assert data["sector_breakdown"] == {}
+    mock_set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_portfolio_summary_when_redis_write_fails(client: AsyncClient, auth_headers):
+    """A failed cache write still returns the computed summary"""
+    headers = await auth_headers("summary_write@example.com", "9876543251")
+
+    previous_redis = getattr(app.state, "redis", None)
+    app.state.redis = object()
+    try:
+        with patch.object(RedisClient, "get", AsyncMock(return_value=None)), \
+                patch.object(RedisClient, "set", AsyncMock(side_effect=RedisConnectionError("down"))) as mock_set:
+            response = await client.get("/api/v1/portfolio/summary", headers=headers)
+    finally:
+        app.state.redis = previous_redis
+
+    assert response.status_code == 200
+    assert response.json()["total_positions"] == 0
+    mock_set.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_positions_and_history_return_every_column(client: AsyncClient, auth_headers, db_session):
+    """Positions and history rows carry every Position column"""
+    headers = await auth_headers("columns@example.com", "9876543252")
+    user_id = (await db_session.execute(
+        text("SELECT id FROM users WHERE email = :email"),
+        {"email": "columns@example.com"}
+    )).scalar_one()
+
+    common = dict(
+        user_id=user_id, symbol="HDFCBANK", token="1333", isin="INE040A01034",
+        side=PositionSide.LONG, product="CNC", quantity=10, entry_price=1500.0,
+        signal_id=7,
+    )
+    db_session.add_all([
+        Position(status=PositionStatus.OPEN, open_quantity=10, **common),
+        Position(
+            status=PositionStatus.CLOSED, open_quantity=0, closed_quantity=10,
+            exit_price=1550.0, exit_time=datetime(2025, 1, 2, 10, 0), **common
+        ),
+    ])
+    await db_session.commit()
+
+    response = await client.get("/api/v1/portfolio/positions", headers=headers)
+    assert response.status_code == 200
+    positions = response.json()["positions"]
+    assert len(positions) == 1
+    assert set(positions[0]) == POSITION_KEYS
+    assert positions[0]["token"] == "1333"
+    assert positions[0]["signal_id"] == 7
+
+    response = await client.get("/api/v1/portfolio/history", headers=headers)
+    assert response.status_code == 200
+    trades = response.json()["trades"]
+    assert len(trades) == 1
+    assert set(trades[0]) == POSITION_KEYS
+    assert trades[0]["isin"] == "INE040A01034"
+    assert trades[0]["product"] == "CNC"
+    assert trades[0]["updated_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_update_stop_loss(client: AsyncClient, auth_headers, db_session):
+    """Stop loss updates only the user's own open positions"""
+    headers = await auth_headers("stoploss@example.com", "9876543253")
+    await auth_headers("stoploss_other@example.com", "9876543254")
+    user_ids = dict((await db_session.execute(
+        text("SELECT email, id FROM users WHERE email LIKE 'stoploss%'")
+    )).all())
+
+    def position(owner: int, status: PositionStatus) -> Position:
+        return Position(
+            user_id=owner, symbol="TCS", side=PositionSide.LONG, status=status,
+            quantity=10, open_quantity=10, entry_price=100.0, stop_loss=90.0
+        )
+
+    open_position = position(user_ids["stoploss@example.com"], PositionStatus.OPEN)
+    closed_position = position(user_ids["stoploss@example.com"], PositionStatus.CLOSED)
+    other_position = position(user_ids["stoploss_other@example.com"], PositionStatus.OPEN)
+    db_session.add_all([open_position, closed_position, other_position])
+    await db_session.commit()
+
+    async def stop_loss_of(position_id: int) -> float:
+        return (await db_session.execute(
+            text("SELECT stop_loss FROM positions WHERE id = :id"), {"id": position_id}
+        )).scalar_one()
+
+    response = await client.post(
+        f"/api/v1/portfolio/positions/{open_position.id}/update-stoploss",
+        params={"stop_loss": 95.0}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json()["stop_loss"] == 95.0
+    assert await stop_loss_of(open_position.id) == 95.0
+
+    for position_id in (closed_position.id, other_position.id):
+        response = await client.post(
+            f"/api/v1/portfolio/positions/{position_id}/update-stoploss",
+            params={"stop_loss": 95.0}, headers=headers
+        )
+        assert response.status_code == 404
+        assert await stop_loss_of(position_id) == 90.0
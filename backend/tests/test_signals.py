@@ -2,8 +2,39 @@
 Signal Tests
 """
 
+import base64
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.api.v1.endpoints import signals as signals_endpoints
+from app.models import SignalStatus
+from app.services.signal_service_smc import signal_service_smc
+
+
+def _smc_result(symbol: str, action: str = "BUY") -> dict:
+    """Minimal SMC service result for a symbol"""
+    return {
+        "trace_id": f"test-{symbol}",
+        "action": action,
+        "direction": "LONG",
+        "quality_score": 0.8,
+        "risk_level": "LOW",
+        "entry_price": 100.0,
+        "stop_loss": 95.0,
+        "target_price": 110.0,
+        "signal_time": "2025-01-01T09:30:00",
+    }
+
+
+async def _fake_generate_signal(symbol: str, **kwargs) -> dict:
+    """SMC stand-in: HOLD for symbols starting with HOLD, error for BAD"""
+    if symbol.startswith("BAD"):
+        raise RuntimeError("analysis failed")
+    return _smc_result(symbol, "HOLD" if symbol.startswith("HOLD") else "BUY")
 
 
 @pytest.mark.asyncio
@@ -100,3 +131,172 @@ async def test_health_check(client: AsyncClient):
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_generate_signals_batch(client: AsyncClient, auth_headers):
+    """Batch generation dedups symbols and reports HOLD and failed ones"""
+    headers = await auth_headers("batch@example.com", "9876543242")
+
+    with patch.object(
+        signal_service_smc, "generate_signal", AsyncMock(side_effect=_fake_generate_signal)
+    ) as mock_generate:
+        response = await client.post(
+            "/api/v1/signals/generate/batch",
+            json=["TCS", " TCS ", "", "HOLDCO", "BADCO", "INFY"],
+            headers=headers
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [signal["symbol"] for signal in data["signals"]] == ["TCS", "INFY"]
+    assert data["skipped"] == ["HOLDCO"]
+    assert data["failed"] == ["BADCO"]
+    # Duplicates and blanks are dropped before analysis
+    assert mock_generate.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_generate_signals_batch_limit(client: AsyncClient, auth_headers):
+    """Symbols beyond MAX_BATCH_SYMBOLS are skipped without analysis"""
+    headers = await auth_headers("batch_limit@example.com", "9876543243")
+
+    with patch.object(signals_endpoints, "MAX_BATCH_SYMBOLS", 2), patch.object(
+        signal_service_smc, "generate_signal", AsyncMock(side_effect=_fake_generate_signal)
+    ) as mock_generate:
+        response = await client.post(
+            "/api/v1/signals/generate/batch",
+            json=["TCS", "INFY", "WIPRO", "HCLTECH"],
+            headers=headers
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [signal["symbol"] for signal in data["signals"]] == ["TCS", "INFY"]
+    assert data["skipped"] == ["WIPRO", "HCLTECH"]
+    assert data["failed"] == []
+    assert mock_generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_signals_batch_all_failed(client: AsyncClient, auth_headers):
+    """A batch with no signals reports every symbol and stores nothing"""
+    headers = await auth_headers("batch_failed@example.com", "9876543244")
+
+    with patch.object(
+        signal_service_smc, "generate_signal", AsyncMock(side_effect=_fake_generate_signal)
+    ):
+        response = await client.post(
+            "/api/v1/signals/generate/batch",
+            json=["BADCO", "HOLDCO"],
+            headers=headers
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"signals": [], "skipped": ["HOLDCO"], "failed": ["BADCO"]}
+
+    response = await client.get("/api/v1/signals/", headers=headers)
+    assert response.json()["signals"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_signals_cursor_pages(client: AsyncClient, auth_headers, db_session):
+    """Cursor pages walk every signal once, breaking created_at ties by id"""
+    headers = await auth_headers("signals_cursor@example.com", "9876543245")
+    user_id = (await db_session.execute(
+        text("SELECT id FROM users WHERE email = :email"),
+        {"email": "signals_cursor@example.com"}
+    )).scalar_one()
+
+    base = datetime(2025, 1, 1, 10, 0)
+    # Three signals share a created_at, so page boundaries fall inside the tie
+    created = [base, base + timedelta(minutes=1), base + timedelta(minutes=1),
+               base + timedelta(minutes=1), base + timedelta(minutes=2)]
+    signals = []
+    for i, at in enumerate(created):
+        signal = signals_endpoints._signal_from_smc(_smc_result(f"SYM{i}"), user_id, f"SYM{i}", "NSE")
+        signal.created_at = at
+        signals.append(signal)
+    db_session.add_all(signals)
+    await db_session.commit()
+    expected = [
+        signal.id for signal in sorted(signals, key=lambda s: (s.created_at, s.id), reverse=True)
+    ]
+
+    response = await client.get("/api/v1/signals/?page_size=2", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 5
+    seen = [signal["id"] for signal in data["signals"]]
+
+    while data["next_cursor"]:
+        response = await client.get(
+            "/api/v1/signals/",
+            params={"page_size": 2, "cursor": data["next_cursor"]},
+            headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        seen.extend(signal["id"] for signal in data["signals"])
+
+    assert seen == expected
+    # The last page has one signal and nothing after it
+    assert len(data["signals"]) == 1
+    assert data["has_next"] is False
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    base64.urlsafe_b64encode(b"5").decode(),
+    base64.urlsafe_b64encode(b'["yesterday", 1]').decode(),
+])
+async def test_get_signals_invalid_cursor(client: AsyncClient, auth_headers, cursor: str):
+    """Malformed cursors are rejected with 400"""
+    headers = await auth_headers("signals_bad_cursor@example.com", "9876543246")
+
+    response = await client.get("/api/v1/signals/", params={"cursor": cursor}, headers=headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.asyncio
+async def test_cancel_signal(client: AsyncClient, auth_headers, db_session):
+    """Active signals cancel; inactive and other users' signals do not"""
+    headers = await auth_headers("signal_cancel@example.com", "9876543247")
+    await auth_headers("signal_cancel_other@example.com", "9876543248")
+    user_ids = dict((await db_session.execute(
+        text("SELECT email, id FROM users WHERE email LIKE 'signal_cancel%'")
+    )).all())
+
+    active, expired, others = (
+        signals_endpoints._signal_from_smc(_smc_result(symbol), user_ids[email], symbol, "NSE")
+        for symbol, email in (
+            ("TCS", "signal_cancel@example.com"),
+            ("INFY", "signal_cancel@example.com"),
+            ("WIPRO", "signal_cancel_other@example.com"),
+        )
+    )
+    expired.status = SignalStatus.EXPIRED
+    db_session.add_all([active, expired, others])
+    await db_session.commit()
+
+    async def status_of(signal_id: int) -> str:
+        return (await db_session.execute(
+            text("SELECT status FROM signals WHERE id = :id"), {"id": signal_id}
+        )).scalar_one()
+
+    response = await client.post(f"/api/v1/signals/{active.id}/cancel", headers=headers)
+    assert response.status_code == 200
+    assert await status_of(active.id) == "CANCELLED"
+
+    response = await client.post(f"/api/v1/signals/{expired.id}/cancel", headers=headers)
+    assert response.status_code == 400
+    assert await status_of(expired.id) == "EXPIRED"
+
+    response = await client.post(f"/api/v1/signals/{others.id}/cancel", headers=headers)
+    assert response.status_code == 404
+    assert await status_of(others.id) == "ACTIVE"
@@ -0,0 +1,82 @@
+"""
+WebSocket Manager Tests
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+
+from app.websocket import manager as manager_module
+from app.websocket.manager import SignalManager
+
+
+def _websocket(send_text=None) -> MagicMock:
+    """Mock WebSocket whose send_text is awaited by the client's sender task"""
+    websocket = MagicMock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = send_text or AsyncMock()
+    return websocket
+
+
+async def _hang(_text: str) -> None:
+    """A send that never completes, like a client that stopped reading"""
+    await asyncio.Event().wait()
+
+
+class TestSignalManager:
+    """Test signal broadcasting through per-client queues"""
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_without_blocking_other_clients(self):
+        """A stalled client loses signals; the broadcast and other clients carry on"""
+        manager = SignalManager()
+        slow = _websocket(AsyncMock(side_effect=_hang))
+        fast = _websocket()
+
+        with patch.object(manager_module, "SIGNAL_QUEUE_SIZE", 1):
+            await manager.connect_signals(slow, "slow")
+            await manager.connect_signals(fast, "fast")
+        await manager.subscribe_signals("slow", ["TCS"])
+        await manager.subscribe_signals("fast", ["TCS"])
+
+        try:
+            for i in range(3):
+                await asyncio.wait_for(
+                    manager.broadcast_signal({"symbol": "TCS", "strategy": "SMC", "id": i}),
+                    timeout=1
+                )
+                await asyncio.sleep(0.01)  # Let the sender tasks run
+
+            sent = [orjson.loads(call.args[0])["data"]["id"] for call in fast.send_text.await_args_list]
+            assert sent == [0, 1, 2]
+
+            # The slow sender is stuck on the first signal, the second waits in
+            # its full queue and the third was dropped
+            slow.send_text.assert_awaited_once()
+            assert manager.signal_queues["slow"].qsize() == 1
+        finally:
+            manager.disconnect_signals("slow")
+            manager.disconnect_signals("fast")
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_sender(self):
+        """Disconnecting a client cancels its sender task and drops its queue"""
+        manager = SignalManager()
+        websocket = _websocket()
+        await manager.connect_signals(websocket, "client")
+        await manager.subscribe_signals("client", ["TCS"])
+        sender = manager.signal_senders["client"]
+
+        manager.disconnect_signals("client")
+        await asyncio.sleep(0)
+
+        assert sender.cancelled()
+        assert "client" not in manager.signal_senders
+        assert "client" not in manager.signal_queues
+        assert "client" not in manager.symbol_signal_subscribers["TCS"]
+
+        # Later broadcasts are not queued or sent for the departed client
+        await manager.broadcast_signal({"symbol": "TCS", "strategy": "SMC"})
+        websocket.send_text.assert_not_awaited()